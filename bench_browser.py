@@ -0,0 +1,104 @@
+import sys
+import json
+import time
+import argparse
+import statistics
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+from browser_profile import BASELINE_ARGS, apply_profile
+
+# Start URL of every scraper and the profile it runs with (see get_driver() in each script)
+TARGETS = {
+    "bluetrail": {"url": "https://www.bluetrail.nl/opdrachten/page/1/?srch=data", "profile": "bluetrail"},
+    "indeed": {"url": "https://nl.indeed.com/jobs?q=Data&fromage=3", "profile": "indeed"},
+    "magnit_global": {"url": "https://portal.magnitglobal.com/supplier/jobrequests/new", "profile": None},
+    "striive": {"url": "https://supplier.striive.com/inbox/all", "profile": None},
+    "circle8": {"url": "https://www.circle8.nl/opdrachten/dynamic-vacatures", "profile": "circle8"},
+}
+
+
+# ----------------------------------------
+# Measurements
+# ----------------------------------------
+def baseline_options():
+    options = Options()
+    for arg in BASELINE_ARGS:
+        options.add_argument(arg)
+    return options
+
+
+def tuned_options(target):
+    # Separate bench-* profile so benchmarking never touches a scraper's own profile
+    profile = f"bench-{target['profile']}" if target["profile"] else None
+    return apply_profile(Options(), name=profile)
+
+
+def measure(driver_path, options, url, pages):
+    """Returns (startup seconds, [page load seconds])."""
+    start = time.perf_counter()
+    driver = webdriver.Chrome(service=Service(driver_path), options=options)
+    startup = time.perf_counter() - start
+
+    loads = []
+    try:
+        for _ in range(pages):
+            start = time.perf_counter()
+            driver.get(url)
+            loads.append(time.perf_counter() - start)
+            driver.get("about:blank")
+    finally:
+        driver.quit()
+    return startup, loads
+
+
+def bench_target(driver_path, name, runs, pages):
+    target = TARGETS[name]
+    result = {}
+    for label, make_options in (("baseline", baseline_options), ("tuned", lambda: tuned_options(target))):
+        startups, loads = [], []
+        for _ in range(runs):
+            startup, page_loads = measure(driver_path, make_options(), target["url"], pages)
+            startups.append(startup)
+            loads.extend(page_loads)
+        result[label] = {
+            "startup_median_s": statistics.median(startups),
+            "startup_first_s": startups[0],
+            "page_load_median_s": statistics.median(loads),
+        }
+    return result
+
+
+# ----------------------------------------
+# Main
+# ----------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Chrome startup/page load, baseline vs tuned profile.")
+    parser.add_argument("targets", nargs="*", default=list(TARGETS), help="Scrapers to benchmark")
+    parser.add_argument("--runs", type=int, default=3, help="Browser launches per profile")
+    parser.add_argument("--pages", type=int, default=3, help="Page loads per launch")
+    parser.add_argument("--json", help="Also write results to this file")
+    args = parser.parse_args(argv)
+
+    driver_path = ChromeDriverManager().install()
+    results = {}
+
+    print(f"{'scraper':<14} {'profile':<9} {'startup':>9} {'1st start':>10} {'page load':>10}")
+    for name in args.targets:
+        results[name] = bench_target(driver_path, name, args.runs, args.pages)
+        for label, r in results[name].items():
+            print(f"{name:<14} {label:<9} {r['startup_median_s']:>8.2f}s "
+                  f"{r['startup_first_s']:>9.2f}s {r['page_load_median_s']:>9.2f}s")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+        print("Saved:", args.json)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
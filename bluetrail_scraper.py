@@ -9,9 +9,19 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 
+from browser_profile import apply_profile
+from extraction_pipeline import ExtractionPipeline
+from extractors import extract_bluetrail
+from metrics import RunMetrics
+from rate_limit import SCHEDULER, polite_get
+
 load_dotenv()
 
 OUTPUT_FILE = f"bluetrail_{datetime.now().strftime('%Y-%m-%d')}.json"
+# sharding.py suffixes this per shard, so parallel shards never share a profile
+PROFILE_NAME = "bluetrail"
+
+metrics = RunMetrics("bluetrail")
 
 
 # ----------------------------------------
@@ -19,15 +29,14 @@ OUTPUT_FILE = f"bluetrail_{datetime.now().strftime('%Y-%m-%d')}.json"
 # ----------------------------------------
 def get_driver():
     chrome_options = Options()
-    chrome_options.add_argument("--headless=new")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--window-size=1920,1080")
-
-    driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
-        options=chrome_options
-    )
+    apply_profile(chrome_options, name=PROFILE_NAME)
+
+    with metrics.timer("browser_start"):
+        driver = webdriver.Chrome(
+            service=Service(ChromeDriverManager().install()),
+            options=chrome_options
+        )
+    metrics.inc("browser_starts")
     return driver
 
 
@@ -36,15 +45,13 @@ def get_driver():
 # ----------------------------------------
 def go_to_page(driver, page_nr):
     url = f"https://www.bluetrail.nl/opdrachten/page/{page_nr+1}/?srch=data"
-    driver.get(url)
-    time.sleep(2)
+    polite_get(driver, url)
     return url
 
 
 def go_to_page_search_term_machine_learning(driver):
     url = "https://www.bluetrail.nl/opdrachten/?s=machine+learning"
-    driver.get(url)
-    time.sleep(2)
+    polite_get(driver, url)
     return url
 
 
@@ -54,102 +61,63 @@ def list_vacancy_links(driver):
     return [c.get_attribute("href") for c in cards]
 
 
-def safe_xpath(driver, xpath, default=""):
-    try:
-        return driver.find_element(By.XPATH, xpath).text.strip()
-    except:
-        return default
-
-
-def safe_list(driver, xpath):
-    try:
-        return [el.text for el in driver.find_elements(By.XPATH, xpath)]
-    except:
-        return []
-
-
 # ----------------------------------------
 # Core scraping logic
 # ----------------------------------------
-def scrape_pages(driver, url):
+def list_units(driver, url):
+    """Vacancy links of a listing page (already opened by go_to_page) as units of work."""
     print("Scraping:", url)
-    driver.get(url)
-    time.sleep(3)
 
     vacancy_links = list_vacancy_links(driver)
-    results = []
-
-    for link in vacancy_links:
-        driver.get(link)
-        time.sleep(2)
-
-        title = safe_xpath(driver, "//h1/span")
-
-        # Expand "show more"
-        try:
-            btn = driver.find_element(By.XPATH, "//a[contains(@class,'show-more')]")
-            driver.execute_script("arguments[0].click();", btn)
-            time.sleep(1)
-        except:
-            pass
-
-        UID = safe_xpath(driver, "(//p/span)[2]")
-        plaats = safe_xpath(driver, "(//p/span)[3]")
-        start = safe_xpath(driver, "(//p/span)[4]")
-        uren = safe_xpath(driver, "(//p/span)[7]")
-        deadline = safe_xpath(driver, "(//p/span)[9]")
-        duur = safe_xpath(driver, "//*[@id='content']//span[3]")
-        eind = safe_xpath(driver, "(//*[@id='text-4']//span)[5]")
-
-        vacature_text = safe_xpath(driver, "//div[h3]")
-
-        eisen = safe_list(driver, "//article//ul[1]/li")
-        wensen = safe_list(driver, "//article//ul[2]/li")
-        competenties = safe_list(driver, "//article//ul[3]/li")
-
-        row = {
-            "UID": UID,
-            "Referentie-nr": UID,
-            "titel": title,
-            "plaats": plaats,
-            "uren": uren,
-            "text": vacature_text,
-            "start": start,
-            "eind": eind,
-            "duur": duur,
-            "deadline": deadline,
-            "eisen": eisen,
-            "wensen": wensen,
-            "competenties": competenties
-        }
-
-        results.append(row)
-        time.sleep(1)
+    metrics.inc("vacancies_found", len(vacancy_links))
+    return [{"key": link, "url": link} for link in vacancy_links]
 
-    return results
 
-
-# ----------------------------------------
-# Main workflow
-# ----------------------------------------
-def main():
-    print("Starting BlueTrail scraper...")
-
-    driver = get_driver()
-    all_rows = []
+def plan(driver):
+    """Collects the vacancies of all listing pages; see sharding.py."""
+    units = []
 
     # Pages with search term 'data'
     for i in range(5):
-        page_url = go_to_page(driver, i)
-        all_rows.extend(scrape_pages(driver, page_url))
+        with metrics.timer("listing_load"):
+            page_url = go_to_page(driver, i)
+        units.extend(list_units(driver, page_url))
 
     # Machine learning page
-    ml_url = go_to_page_search_term_machine_learning(driver)
-    all_rows.extend(scrape_pages(driver, ml_url))
+    with metrics.timer("listing_load"):
+        ml_url = go_to_page_search_term_machine_learning(driver)
+    units.extend(list_units(driver, ml_url))
+
+    # The same vacancy often shows up on several listing pages
+    return list({unit["key"]: unit for unit in units}.values())
+
 
-    driver.quit()
+def scrape_vacancy(driver, link, pipeline):
+    """Loads a vacancy and hands its HTML to the pipeline."""
+    # Pacing comes from the per-host budget instead of fixed sleeps
+    with metrics.timer("vacancy_load"):
+        polite_get(driver, link)
 
-    df = pd.DataFrame(all_rows)
+    # Expand "show more"
+    try:
+        btn = driver.find_element(By.XPATH, "//a[contains(@class,'show-more')]")
+        driver.execute_script("arguments[0].click();", btn)
+        time.sleep(1)
+    except:
+        pass
+
+    page_source = driver.page_source
+    metrics.add_bytes(page_source)
+    pipeline.submit(extract_bluetrail, page_source)
+
+
+def execute(driver, units, pipeline):
+    for unit in units:
+        scrape_vacancy(driver, unit["url"], pipeline)
+
+
+def save(rows, output_file=OUTPUT_FILE):
+    df = pd.DataFrame(rows)
     df = df.drop_duplicates("UID").set_index("UID")
 
     df = df[
@@ -157,8 +125,33 @@ def main():
          "start", "eind", "duur", "deadline", "eisen", "wensen", "competenties"]
     ]
 
-    df.to_json(OUTPUT_FILE, orient="index", indent=4)
-    print("Saved:", OUTPUT_FILE)
+    with metrics.timer("save"):
+        df.to_json(output_file, orient="index", indent=4)
+    print("Saved:", output_file)
+
+    metrics.observe_rows(df.reset_index().to_dict("records"))
+
+
+# ----------------------------------------
+# Main workflow
+# ----------------------------------------
+def main():
+    print("Starting BlueTrail scraper...")
+
+    driver = get_driver()
+
+    with ExtractionPipeline() as pipeline:
+        execute(driver, plan(driver), pipeline)
+
+        driver.quit()
+        with metrics.timer("extract_wait"):
+            all_rows = pipeline.results()
+        metrics.inc("vacancies_failed", pipeline.failed)
+
+    save(all_rows)
+
+    metrics.extra["rate_limit"] = SCHEDULER.stats()
+    metrics.write()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,81 @@
+import os
+import sys
+import argparse
+
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+from browser_profile import apply_profile
+from extractors import MAGNIT_DETAIL, clean_text, parse, text_of
+
+# Text fields per source whose value comes from a whole block of markup
+CHECK_XPATHS = {
+    "bluetrail": ["//div[h3]", "//article//ul[1]/li"],
+    "striive": ["//section[4]/p", "(//section[3]//ul)[1]/li"],
+    "magnit_global": [MAGNIT_DETAIL + "/div[3]/div[1]/pre"],
+    "indeed": ["//*[@id='jobDescriptionText']"],
+    "circle8": ["//main"],
+}
+
+
+# ----------------------------------------
+# Compare selenium's .text with extractors.text_of on a saved page
+# ----------------------------------------
+def compare(driver, path, xpaths):
+    """Returns [(xpath, index, selenium text, extractor text)] for every mismatch."""
+    with open(path, encoding="utf-8") as f:
+        tree = parse(f.read())
+    driver.get("file://" + os.path.abspath(path))
+
+    mismatches = []
+    for xpath in xpaths:
+        elements = driver.find_elements(By.XPATH, xpath)
+        nodes = tree.xpath(xpath)
+        if len(elements) != len(nodes):
+            mismatches.append((xpath, None, f"{len(elements)} elementen", f"{len(nodes)} nodes"))
+            continue
+        for i, (element, node) in enumerate(zip(elements, nodes)):
+            expected = clean_text(element.text)
+            got = text_of(node)
+            if expected != got:
+                mismatches.append((xpath, i, expected, got))
+    return mismatches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Check extractors against selenium's .text on saved pages (driver.page_source dumps)."
+    )
+    parser.add_argument("source", choices=sorted(CHECK_XPATHS))
+    parser.add_argument("pages", nargs="+", help="Saved HTML files")
+    parser.add_argument("--xpath", action="append", help="Check this XPath instead of the defaults")
+    args = parser.parse_args(argv)
+
+    options = Options()
+    apply_profile(options)
+    # A saved page must not run its scripts again and rewrite the DOM
+    options.add_experimental_option("prefs", {"profile.managed_default_content_settings.javascript": 2})
+    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+
+    failed = 0
+    try:
+        for path in args.pages:
+            mismatches = compare(driver, path, args.xpath or CHECK_XPATHS[args.source])
+            if not mismatches:
+                print(f"✅ {path}: gelijk")
+                continue
+            failed += 1
+            for xpath, i, expected, got in mismatches:
+                print(f"❌ {path} {xpath} [{i}]")
+                print(f"   selenium:   {expected[:300]!r}")
+                print(f"   extractors: {got[:300]!r}")
+    finally:
+        driver.quit()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
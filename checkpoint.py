@@ -0,0 +1,89 @@
+import os
+import json
+import threading
+from datetime import datetime
+
+CHECKPOINT_DIR = "checkpoints"
+
+
+# ----------------------------------------
+# Append-only checkpoint log per source and day
+# ----------------------------------------
+class Checkpoint:
+    """
+    Records finished work (sections, vacancy keys) and their rows in
+    checkpoints/<source>_<date>.ndjson. Every entry is flushed and fsynced,
+    so after a crash a rerun on the same day skips what is already done and
+    starts from previous_rows. A torn last line from a crash (no trailing
+    newline) is cut off before appending, so new entries never end up on it.
+    """
+
+    def __init__(self, source, date=None, directory=CHECKPOINT_DIR):
+        date = date or datetime.now().strftime("%Y-%m-%d")
+        self.path = os.path.join(directory, f"{source}_{date}.ndjson")
+        self.done = set()
+        self.previous_rows = []
+        self._pending = 0
+        self._cond = threading.Condition()
+
+        if os.path.exists(self.path):
+            complete = 0
+            with open(self.path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    complete += len(line)
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    self.done.add(entry["key"])
+                    if entry.get("row") is not None:
+                        self.previous_rows.append(entry["row"])
+            if complete < os.path.getsize(self.path):
+                with open(self.path, "r+b") as f:
+                    f.truncate(complete)
+                    os.fsync(f.fileno())
+            print(f"[+] Checkpoint {self.path}: {len(self.done)} klaar, hervat run")
+
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def is_done(self, key):
+        return key in self.done
+
+    def mark_done(self, key, row=None):
+        with self._cond:
+            self._file.write(json.dumps({"key": key, "row": row}, ensure_ascii=False) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self.done.add(key)
+
+    def track(self, future, key):
+        """Marks key done with the future's row once an ExtractionPipeline job finishes."""
+        with self._cond:
+            self._pending += 1
+
+        def record(f):
+            try:
+                row = None if f.exception() else f.result()
+                if row is not None:
+                    self.mark_done(key, row)
+            finally:
+                with self._cond:
+                    self._pending -= 1
+                    self._cond.notify_all()
+
+        future.add_done_callback(record)
+
+    def wait_pending(self):
+        """Blocks until every tracked future has been written to the log."""
+        with self._cond:
+            while self._pending:
+                self._cond.wait()
+
+    def close(self, completed=False):
+        """Closes the log; a completed run removes it so tomorrow starts clean."""
+        self._file.close()
+        if completed:
+            os.remove(self.path)
@@ -1,15 +1,16 @@
-import os
-import time
-import hashlib
-import pandas as pd
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+from playwright.sync_api import sync_playwright
+
+from browser_profile import playwright_args
+from extraction_pipeline import ExtractionPipeline
+from extractors import extract_circle8
+from json_store import upsert_index_json
+from metrics import RunMetrics
+from rate_limit import SCHEDULER, polite_goto
 
 JSON_FILE = "./circle8.json"
 ASSIGNMENTS_URL = "https://www.circle8.nl/opdrachten/dynamic-vacatures"
 
-
-def uid_from_url(url: str) -> str:
-    return "UID-" + hashlib.md5(url.encode("utf-8")).hexdigest()[:12]
+metrics = RunMetrics("circle8")
 
 
 def apply_stealth(page):
@@ -24,7 +25,7 @@ def apply_stealth(page):
 def collect_all_vacancy_urls(page) -> list[str]:
     """Haalt alle 'Bekijk opdracht'-links van de opdrachtenpagina."""
     print(f"[+] Open opdrachtenpagina: {ASSIGNMENTS_URL}")
-    page.goto(ASSIGNMENTS_URL, wait_until="networkidle", timeout=30000)
+    polite_goto(page, ASSIGNMENTS_URL, wait_until="networkidle", timeout=30000)
 
     # Scroll een paar keer voor de zekerheid
     for _ in range(8):
@@ -54,39 +55,27 @@ def collect_all_vacancy_urls(page) -> list[str]:
     return urls
 
 
-def scrape_vacancy(page, url: str) -> dict:
+def fetch_vacancy(page, url: str) -> str:
+    """Loads a vacancy and returns its HTML; extraction runs in the pipeline."""
     print(f"    [*] Scrape vacature: {url}")
-    page.goto(url, wait_until="domcontentloaded", timeout=30000)
-    page.wait_for_timeout(1000)
-    page.mouse.wheel(0, 1500)
-    page.wait_for_timeout(500)
-
-    try:
-        title = page.locator("h1").first.inner_text().strip()
-    except PlaywrightTimeoutError:
-        title = ""
-
-    try:
-        main_text = page.locator("main").inner_text().strip()
-    except PlaywrightTimeoutError:
-        main_text = page.content()[:4000]
-
-    uid = uid_from_url(url)
-
-    return {
-        "UID": uid,
-        "titel": title,
-        "text": main_text,
-        "url": url,
-    }
+    with metrics.timer("vacancy_load"):
+        polite_goto(page, url, wait_until="domcontentloaded", timeout=30000)
+        page.wait_for_timeout(1000)
+        page.mouse.wheel(0, 1500)
+        page.wait_for_timeout(500)
+        html = page.content()
+    metrics.add_bytes(html)
+    return html
 
 
 def main():
     with sync_playwright() as p:
-        browser = p.chromium.launch(
-            headless=True,
-            args=["--disable-blink-features=AutomationControlled"],
-        )
+        with metrics.timer("browser_start"):
+            browser = p.chromium.launch(
+                headless=True,
+                args=["--disable-blink-features=AutomationControlled", *playwright_args()],
+            )
+        metrics.inc("browser_starts")
 
         context = browser.new_context(
             viewport={"width": 1920, "height": 1080},
@@ -100,52 +89,47 @@ def main():
         page = context.new_page()
         apply_stealth(page)
 
-        urls = collect_all_vacancy_urls(page)
+        with metrics.timer("listing_load"):
+            urls = collect_all_vacancy_urls(page)
+        metrics.inc("vacancies_found", len(urls))
 
         if not urls:
             print("[!] Geen enkele vacature-URL gevonden. circle8.json wordt niet aangepast.")
             browser.close()
+            metrics.extra["rate_limit"] = SCHEDULER.stats()
+            metrics.write()
             return
 
-        rows = []
-        for url in urls:
-            try:
-                row = scrape_vacancy(page, url)
-                rows.append(row)
-            except Exception as e:
-                print(f"    [!] Fout bij vacature {url}: {e}")
+        with ExtractionPipeline() as pipeline:
+            for url in urls:
+                try:
+                    pipeline.submit(extract_circle8, fetch_vacancy(page, url), url)
+                except Exception as e:
+                    print(f"    [!] Fout bij vacature {url}: {e}")
+                    metrics.inc("vacancies_failed")
+            with metrics.timer("extract_wait"):
+                rows = pipeline.results()
+            metrics.inc("vacancies_failed", pipeline.failed)
+        metrics.observe_rows(rows)
 
         if not rows:
             print("[!] Geen vacatures succesvol gescraped. circle8.json wordt niet aangepast.")
             browser.close()
+            metrics.extra["rate_limit"] = SCHEDULER.stats()
+            metrics.write()
             return
 
-        new_df = pd.DataFrame(rows).set_index("UID")
-        print(f"[+] Nieuwe scrapes (uniek): {len(new_df)}")
-
-        # Merge met bestaande JSON
-        if os.path.exists(JSON_FILE):
-            try:
-                old_df = pd.read_json(JSON_FILE, orient="index")
-                print(f"[+] Bestaande JSON geladen met {len(old_df)} rijen.")
-            except Exception:
-                print("[!] Kon bestaande JSON niet lezen, start opnieuw.")
-                old_df = pd.DataFrame()
-
-            if not old_df.empty:
-                # oude rijen behouden die nog niet in new_df zitten
-                to_keep = old_df[~old_df.index.isin(new_df.index)]
-                final_df = pd.concat([to_keep, new_df])
-            else:
-                final_df = new_df
-        else:
-            final_df = new_df
-
-        final_df = final_df[~final_df.index.duplicated(keep="first")]
-        final_df.to_json(JSON_FILE, orient="index", indent=2, force_ascii=False)
-        print(f"[✅] circle8.json bijgewerkt met {len(final_df)} records.")
+        print(f"[+] Nieuwe scrapes (uniek): {len(rows)}")
+
+        # Merge met bestaande JSON: streamen + upsert, atomair weggeschreven
+        with metrics.timer("save"):
+            kept, upserted = upsert_index_json(JSON_FILE, rows, key="UID", source="circle8")
+        print(f"[+] Bestaande records behouden: {kept}")
+        print(f"[✅] circle8.json bijgewerkt met {kept + upserted} records.")
 
         browser.close()
+        metrics.extra["rate_limit"] = SCHEDULER.stats()
+        metrics.write()
 
 
 if __name__ == "__main__":
@@ -8,6 +8,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
+from browser_profile import apply_profile
 
 JSON_FILE="circle8.json"
 TIMEOUT=25
@@ -34,14 +35,14 @@ def wait_for_any(driver, selectors, timeout=25):
 
 def create_driver():
     proxy=os.getenv("PROXY","")
+    # Headful under xvfb by default (passes the bot check more often); CIRCLE8_HEADLESS=1 to skip xvfb
+    headless=os.getenv("CIRCLE8_HEADLESS","0")=="1"
     options=uc.ChromeOptions()
     options.binary_location="/usr/bin/google-chrome"
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--window-size=1920,1080")
+    apply_profile(options, name="circle8", headless=False)
     if proxy:
         options.add_argument(f"--proxy-server={proxy}")
-    driver=uc.Chrome(options=options, headless=False, use_subprocess=True)
+    driver=uc.Chrome(options=options, headless=headless, use_subprocess=True)
     return driver
 
 def scrape_search_term(driver, term):
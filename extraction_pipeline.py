@@ -0,0 +1,68 @@
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+
+# ----------------------------------------
+# Browser -> process pool hand-off
+# ----------------------------------------
+class ExtractionPipeline:
+    """
+    Runs CPU-bound extraction of page snapshots in a process pool.
+
+    The browser thread only fetches pages and calls submit() with the raw
+    HTML; parsing happens in parallel while the browser loads the next page.
+    At most max_pending snapshots are in flight: submit() blocks when the
+    pool falls behind, so memory stays bounded however long the run is.
+
+    Extract functions must be module-level (picklable), see extractors.py.
+    Results come back in submission order; None results and failed
+    extractions are dropped, like the old inline `except: continue`.
+    """
+
+    def __init__(self, max_workers=None, max_pending=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 2 * self.max_workers
+        self.executor = ProcessPoolExecutor(self.max_workers)
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._futures = []
+        self.submitted = 0
+        self.failed = 0
+
+    def submit(self, fn, *args):
+        self._slots.acquire()
+        try:
+            future = self.executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+        self.submitted += 1
+        return future
+
+    def results(self):
+        """Waits for everything submitted so far and returns the rows."""
+        rows = []
+        for future in self._futures:
+            try:
+                row = future.result()
+            except Exception as e:
+                print("[!] Extractie mislukt:", e)
+                self.failed += 1
+                continue
+            if row is None:
+                self.failed += 1
+            else:
+                rows.append(row)
+        self._futures = []
+        return rows
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,238 @@
+import re
+import hashlib
+from lxml import html as lxml_html
+
+# ----------------------------------------
+# HTML -> row extraction, run in the ExtractionPipeline worker processes.
+# XPaths are the same ones the scrapers used with driver.find_element.
+# ----------------------------------------
+_SOURCE_WHITESPACE = re.compile(r"\s+")
+
+# Markers used while laying out text, resolved by _resolve_breaks():
+_SOFT_BREAK = "\x00"  # block boundary: new line only if the current line has text
+_HARD_BREAK = "\x01"  # <br>: always a new line, surrounding spaces dropped
+_PRE_SPACE = "\x02"   # spaces and newlines inside <pre>, kept exactly
+_PRE_NEWLINE = "\x03"
+
+# Never rendered, so never part of selenium's .text
+SKIP_TAGS = {"script", "style", "noscript", "template", "head", "title", "meta", "link"}
+
+# Rendered on their own line(s); <br> is a line break of its own
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "dd", "details", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5",
+    "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section", "summary",
+    "table", "tbody", "tfoot", "thead", "tr", "ul",
+}
+CELL_TAGS = {"td", "th"}
+
+
+def clean_text(text):
+    """
+    Final touch close to what selenium's .text returns: non-breaking
+    spaces become spaces and surrounding whitespace goes. Blank lines,
+    indentation and <pre> content are kept.
+    """
+    return (text or "").replace("\r\n", "\n").replace("\u00a0", " ").strip()
+
+
+def _hidden(node):
+    style = (node.get("style") or "").replace(" ", "").lower()
+    return node.get("hidden") is not None or "display:none" in style
+
+
+def _resolve_breaks(text):
+    # Outside <pre>: one space at most, none at the end of a line
+    text = re.sub(" +", " ", text)
+    text = re.sub(f" +(?=[{_SOFT_BREAK}{_HARD_BREAK}{_PRE_NEWLINE}])", "", text)
+    text = re.sub(f" *{_HARD_BREAK} *", _HARD_BREAK, text)
+    text = re.sub(f" *{_SOFT_BREAK}[ {_SOFT_BREAK}]*", _SOFT_BREAK, text)
+    # A block boundary at the start of a line adds nothing
+    text = re.sub(f"(^|(?<=[{_HARD_BREAK}{_PRE_NEWLINE}])){_SOFT_BREAK}", "", text)
+    for marker in (_SOFT_BREAK, _HARD_BREAK, _PRE_NEWLINE):
+        text = text.replace(marker, "\n")
+    return text.replace(_PRE_SPACE, " ")
+
+
+def rendered_text(node):
+    """
+    Text of node roughly as the browser lays it out (selenium's .text):
+    script/style and hidden nodes are left out, block elements start a new
+    line (without adding empty ones), <br> always breaks the line, table
+    cells are separated by a space, and source whitespace collapses to one
+    space except inside <pre>, where it is kept as is.
+
+    lxml's text_content() just concatenates text nodes, which glues
+    "<p>a</p><p>b</p>" into "ab".
+    """
+    parts = []
+    stack = [(node, False)]
+    while stack:
+        item, pre = stack.pop()
+        if isinstance(item, str):
+            if pre:
+                parts.append(item.replace(" ", _PRE_SPACE).replace("\n", _PRE_NEWLINE))
+            else:
+                parts.append(_SOURCE_WHITESPACE.sub(" ", item))
+            continue
+        tag = item.tag if isinstance(item.tag, str) else None
+        if tag is None or tag in SKIP_TAGS or _hidden(item):
+            continue
+        if tag == "br":
+            parts.append(_HARD_BREAK)
+            continue
+
+        pre = pre or tag in ("pre", "textarea")
+        sep = _SOFT_BREAK if tag in BLOCK_TAGS else " " if tag in CELL_TAGS else ""
+        todo = [sep, (item.text or "", pre)]
+        for child in item:
+            # The tail belongs to the parent, so it survives a skipped child
+            todo += [(child, pre), (child.tail or "", pre)]
+        todo.append(sep)
+        stack.extend(reversed([t if isinstance(t, tuple) else (t, False) for t in todo]))
+    return _resolve_breaks("".join(parts))
+
+
+def css_class(name):
+    """XPath predicate for a CSS class, so we don't need cssselect."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def parse(page_source):
+    return lxml_html.fromstring(page_source)
+
+
+def text_of(node):
+    if node is None:
+        return ""
+    if isinstance(node, str):
+        return clean_text(node)
+    return clean_text(rendered_text(node))
+
+
+def first(tree, xpath, default=""):
+    found = tree.xpath(xpath)
+    return text_of(found[0]) if found else default
+
+
+def all_texts(tree, xpath):
+    return [text_of(n) for n in tree.xpath(xpath)]
+
+
+def only_digits_and_dashes(value):
+    return "".join(c for c in value if c.isdigit() or c == "-")
+
+
+# ----------------------------------------
+# Per-source extractors
+# ----------------------------------------
+def extract_bluetrail(page_source):
+    tree = parse(page_source)
+    UID = first(tree, "(//p/span)[2]")
+    return {
+        "UID": UID,
+        "Referentie-nr": UID,
+        "titel": first(tree, "//h1/span"),
+        "plaats": first(tree, "(//p/span)[3]"),
+        "uren": first(tree, "(//p/span)[7]"),
+        "text": first(tree, "//div[h3]"),
+        "start": first(tree, "(//p/span)[4]"),
+        "eind": first(tree, "(//*[@id='text-4']//span)[5]"),
+        "duur": first(tree, "//*[@id='content']//span[3]"),
+        "deadline": first(tree, "(//p/span)[9]"),
+        "eisen": all_texts(tree, "//article//ul[1]/li"),
+        "wensen": all_texts(tree, "//article//ul[2]/li"),
+        "competenties": all_texts(tree, "//article//ul[3]/li"),
+    }
+
+
+def extract_striive(page_source, uid):
+    tree = parse(page_source)
+
+    def t(xpath):
+        return first(tree, xpath)
+
+    def items(xpath):
+        return [txt for txt in all_texts(tree, xpath)[:29] if txt]
+
+    return {
+        "UID": uid,
+        "referentie_code": t('(//span[@class="field-value"])[7]'),
+        "vacature": t('//header//div/div[2]'),
+        "plaats": t('(//section[2]//span[@class="field-value"])[2]'),
+        "uren": t('(//section[2]//span[@class="field-value"])[1]'),
+        "text": t('//section[4]/p') or t('//section[5]/p'),
+        "start": only_digits_and_dashes(t('(//section[2]//span[@class="field-value"])[3]')),
+        "eind": t('(//span[@class="field-value"])[3]'),
+        "deadline": only_digits_and_dashes(t('(//section[2]//span[@class="field-value"])[4]')),
+        "eisen": items("(//section[3]//ul)[1]/li"),
+        "wensen": items("(//section[3]//ul)[2]/li//span/span"),
+    }
+
+
+MAGNIT_DETAIL = '//*[@id="list-nieuw-item-1"]'
+MAGNIT_PERIOD = MAGNIT_DETAIL + '/div[2]/div/div[2]/app-period/div/div[2]'
+
+
+def extract_magnit(page_source, row_xpath):
+    """Returns None when a field is missing, like the old `except: continue`."""
+    tree = parse(page_source)
+
+    def required(xpath):
+        found = tree.xpath(xpath)
+        if not found:
+            raise LookupError(xpath)
+        return text_of(found[0])
+
+    try:
+        return {
+            "UID": required(f"{row_xpath}/datatable-body-row/div/datatable-body-cell[1]/div/span"),
+            "titel": required(MAGNIT_DETAIL + "/div[2]/h3"),
+            "start datum": "".join(required(f"{MAGNIT_PERIOD}/div[1]/div[{i}]") for i in (1, 2, 3)),
+            "eind datum": "".join(required(f"{MAGNIT_PERIOD}/div[2]/div[{i}]") for i in (1, 2, 3)),
+            "deadline aanvraag": required("(//app-icon-label/div/div[2]/div[2]/span)[2]"),
+            "locatie": required("(//app-icon-label/div/div[2]/div[2]/span)[1]"),
+            "uren per week": required("//app-icon-label/div/div[2]/div[2]/span"),
+            "ervaring in jaren": required("(//app-icon-label/div/div[2]/div[2]/span)[4]"),
+            "max uur tarief": required("(//app-icon-label/div/div[2]/div[2]/span)[3]"),
+            "vacature tekst": required(MAGNIT_DETAIL + "/div[3]/div[1]/pre"),
+        }
+    except LookupError:
+        return None
+
+
+def extract_indeed(page_source):
+    tree = parse(page_source)
+    title = first(tree, f"//*[{css_class('jobsearch-JobInfoHeader-title')}]", None)
+    details = tree.xpath(f"//*[{css_class('jobsearch-RightPane')}]")
+    if title is None or not details:
+        return None
+    details = details[0]
+
+    job = {"title": title}
+    fields = {
+        "company": (details, ".//div[@data-company-name='true']"),
+        "location": (tree, "//*[@id='jobLocationText']"),
+        "pay": (tree, "//*[@id='salaryInfoAndJobType']//span"),
+        "description": (details, ".//*[@id='jobDescriptionText']"),
+    }
+    for name, (root, xpath) in fields.items():
+        found = root.xpath(xpath)
+        if found:
+            job[name] = text_of(found[0])
+    return job
+
+
+def uid_from_url(url):
+    return "UID-" + hashlib.md5(url.encode("utf-8")).hexdigest()[:12]
+
+
+def extract_circle8(page_source, url):
+    tree = parse(page_source)
+    main = tree.xpath("//main")
+    return {
+        "UID": uid_from_url(url),
+        "titel": first(tree, "//h1"),
+        "text": text_of(main[0]) if main else page_source[:4000],
+        "url": url,
+    }
@@ -1,12 +1,10 @@
 import json
-import time
-import random
 import traceback
 from datetime import datetime
 import os
 
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
@@ -15,6 +13,31 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 
+from browser_profile import apply_profile
+from extraction_pipeline import ExtractionPipeline
+from extractors import extract_indeed
+from metrics import RunMetrics
+from rate_limit import SCHEDULER, driver_is_blocked, polite_action, polite_get
+
+
+INDEED_URL = "https://nl.indeed.com/"
+
+QUERY_URLS = [
+    "https://nl.indeed.com/jobs?q=Data&fromage=3",
+    "https://nl.indeed.com/jobs?q=machine+learning&fromage=3",
+    "https://nl.indeed.com/jobs?q=data+analyst&fromage=3",
+]
+PAGES_PER_QUERY = 5
+PLAN_NEEDS_DRIVER = False
+
+# sharding.py suffixes both per shard, so parallel shards never share them
+PROFILE_NAME = "indeed"
+DEBUG_PREFIX = "debug_page"
+
+OUTPUT_FILE = f"indeed_{datetime.now().strftime('%Y-%m-%d')}.json"
+
+metrics = RunMetrics("indeed")
+
 
 # ---------------------------------------------------------
 # Configure Selenium with WebShare.io Proxy
@@ -23,10 +46,7 @@ def get_driver():
     proxy = os.getenv("PROXY_URL")   # from GitHub Secrets
         
     options = Options()
-    options.add_argument("--headless=new")  
-    options.add_argument("--window-size=1920,1080")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
+    apply_profile(options, name=PROFILE_NAME)
 
     # Proxy for Webshare
     if proxy:
@@ -38,10 +58,12 @@ def get_driver():
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option("useAutomationExtension", False)
 
-    driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
-        options=options
-    )
+    with metrics.timer("browser_start"):
+        driver = webdriver.Chrome(
+            service=Service(ChromeDriverManager().install()),
+            options=options
+        )
+    metrics.inc("browser_starts")
 
     # Hide Selenium fingerprint
     driver.execute_script(
@@ -63,84 +85,78 @@ def save_debug(driver, name):
         print("⚠️ Failed to write debug HTML:", str(e))
 
 
+# ---------------------------------------------------------
+# Plan: every (query, result page) is a unit of work
+# ---------------------------------------------------------
+def plan(driver=None):
+    """Indeed pages with &start=0,10,20,...; no browser needed to plan."""
+    units = []
+    for query_url in QUERY_URLS:
+        for page in range(PAGES_PER_QUERY):
+            url = f"{query_url}&start={10 * page}"
+            units.append({"key": url, "url": url})
+    return units
+
+
 # ---------------------------------------------------------
 # Scrape Indeed job cards
 # ---------------------------------------------------------
-def scrape(driver):
-    jobs = []
-    pages_scraped = 0
-    pages_to_scrape = 5
-
-    while pages_scraped < pages_to_scrape:
-        time.sleep(random.uniform(3, 6))
-
-        job_cards = driver.find_elements(By.CSS_SELECTOR, ".cardOutline")
-        save_debug(driver, f"debug_page_{pages_scraped}")
-
-        if not job_cards:
-            print("⚠ No job cards found on this page.")
-            return jobs
-
-        for job_card in job_cards:
-            job = {}
-
-            try:
-                driver.execute_script("arguments[0].scrollIntoView();", job_card)
-                job_card.click()
-            except:
-                continue
-
-            # Title
-            try:
-                title_el = WebDriverWait(driver, 6).until(
-                    EC.presence_of_element_located(
-                        (By.CSS_SELECTOR, ".jobsearch-JobInfoHeader-title")
-                    )
+def scrape_page(driver, url, pipeline, debug_name):
+    print("🔎 Scraping:", url)
+    with metrics.timer("listing_load"):
+        loaded = polite_get(driver, url)
+    if not loaded:
+        print("⚠ Still blocked after retries:", url)
+
+    try:
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, ".cardOutline"))
+        )
+    except TimeoutException:
+        pass
+
+    job_cards = driver.find_elements(By.CSS_SELECTOR, ".cardOutline")
+    save_debug(driver, debug_name)
+
+    if not job_cards:
+        print("⚠ No job cards found on this page.")
+        return
+    metrics.inc("vacancies_found", len(job_cards))
+
+    for job_card in job_cards:
+        def open_card():
+            driver.execute_script("arguments[0].scrollIntoView();", job_card)
+            job_card.click()
+            WebDriverWait(driver, 6).until(
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, ".jobsearch-JobInfoHeader-title")
                 )
-                job["title"] = title_el.text
-            except:
-                continue
-
-            # Job details container
-            try:
-                details = driver.find_element(By.CSS_SELECTOR, ".jobsearch-RightPane")
-            except:
-                continue
-
-            # Extract fields
-            try: job["company"] = details.find_element(
-                    By.CSS_SELECTOR, "div[data-company-name='true']"
-                ).text
-            except: pass
-
-            try: job["location"] = driver.find_element(By.ID, "jobLocationText").text
-            except: pass
-
-            try: job["pay"] = driver.find_element(
-                    By.CSS_SELECTOR, "#salaryInfoAndJobType span"
-                ).text
-            except: pass
-
-            try: job["description"] = details.find_element(
-                    By.ID, "jobDescriptionText"
-                ).text
-            except: pass
-
-            jobs.append(job)
-            time.sleep(random.uniform(1, 2))
-
-        # Next page
-        try:
-            next_btn = driver.find_element(
-                By.CSS_SELECTOR, "a[data-testid='pagination-page-next']"
             )
-            next_btn.click()
-        except NoSuchElementException:
-            break
 
-        pages_scraped += 1
+        # Click + wait for the details pane, paced by the Indeed budget
+        try:
+            with metrics.timer("vacancy_load"):
+                polite_action(INDEED_URL, open_card, check=lambda: driver_is_blocked(driver))
+        except:
+            metrics.inc("vacancies_failed")
+            continue
+
+        page_source = driver.page_source
+        metrics.add_bytes(page_source)
+        pipeline.submit(extract_indeed, page_source)
+
 
-    return jobs
+def execute(driver, units, pipeline):
+    for i, unit in enumerate(units):
+        scrape_page(driver, unit["url"], pipeline, f"{DEBUG_PREFIX}_{i}")
+
+
+def save(rows, output_file=OUTPUT_FILE):
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump({"jobs": rows}, f, indent=4)
+
+    print("📁 Saved:", output_file)
+    metrics.observe_rows(rows)
 
 
 # ---------------------------------------------------------
@@ -148,40 +164,29 @@ def scrape(driver):
 # ---------------------------------------------------------
 def main():
     driver = get_driver()
-
-    urls = [
-        "https://nl.indeed.com/jobs?q=Data&fromage=3",
-        "https://nl.indeed.com/jobs?q=machine+learning&fromage=3",
-        "https://nl.indeed.com/jobs?q=data+analyst&fromage=3",
-    ]
-
-    all_jobs = []
+    pipeline = ExtractionPipeline()
 
     try:
-        for i, url in enumerate(urls):
-            print("🔎 Scraping:", url)
-            driver.get(url)
-            time.sleep(5)
-            save_debug(driver, f"debug_loaded_{i}")
-
-            jobs = scrape(driver)
-            all_jobs.extend(jobs)
+        execute(driver, plan(), pipeline)
 
     except Exception as e:
         save_debug(driver, "debug_crash")
         print("❌ Error:", e)
         print(traceback.format_exc())
+        metrics.write()
         raise
 
     finally:
         driver.quit()
+        with metrics.timer("extract_wait"):
+            all_jobs = pipeline.results()
+        metrics.inc("vacancies_failed", pipeline.failed)
+        pipeline.close()
 
-    # Save JSON
-    filename = f"indeed_{datetime.now().strftime('%Y-%m-%d')}.json"
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump({"jobs": all_jobs}, f, indent=4)
+    save(all_jobs)
 
-    print("📁 Saved:", filename)
+    metrics.extra["rate_limit"] = SCHEDULER.stats()
+    metrics.write()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,96 @@
+import os
+import json
+import tempfile
+from contextlib import contextmanager
+
+from snapshots import iter_raw_items
+
+# Read once at import; os.umask can only be read by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+# ----------------------------------------
+# Atomic writes
+# ----------------------------------------
+@contextmanager
+def atomic_write(path, encoding="utf-8", mode=None):
+    """
+    Opens a temp file next to path and renames it over path on success.
+
+    A crash before the rename leaves the previous file untouched. mkstemp
+    creates the temp file as 0600; it gets the mode of the file it replaces,
+    or 0666 minus the umask for a new file, like a plain open() would.
+    Pass mode to force specific permissions.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", suffix=os.path.basename(path), dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        if mode is None:
+            try:
+                mode = os.stat(path).st_mode & 0o7777
+            except FileNotFoundError:
+                mode = 0o666 & ~_UMASK
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _entry(key, row, indent):
+    """One '"key": {...}' member of an orient="index" object, already indented."""
+    return json.dumps({key: row}, indent=indent, ensure_ascii=False)[2:-2]
+
+
+# ----------------------------------------
+# Streaming upsert for orient="index" files
+# ----------------------------------------
+def upsert_index_json(path, rows, key="UID", source=None, indent=2):
+    """
+    Upserts rows into an orient="index" JSON file such as circle8.json.
+
+    The existing file is streamed entry by entry; entries whose key is in
+    rows are replaced by the new version, which is appended at the end (the
+    same order the old pandas isin/concat merge produced). Only the new rows
+    are held in memory. Returns (kept, upserted).
+    """
+    new_rows = {}
+    for row in rows:
+        row = dict(row)
+        new_rows[str(row.pop(key))] = row
+
+    kept = 0
+    with atomic_write(path) as f:
+        f.write("{\n")
+        first = True
+        if os.path.exists(path):
+            try:
+                for old_key, old_row in iter_raw_items(path, source):
+                    if old_key in new_rows:
+                        continue
+                    f.write(("" if first else ",\n") + _entry(old_key, old_row, indent))
+                    first = False
+                    kept += 1
+            except Exception as e:
+                # Same behaviour as before: an unreadable file is replaced by the new rows only
+                print(f"[!] Kon bestaande JSON niet lezen ({e}), start opnieuw.")
+                f.seek(0)
+                f.truncate()
+                f.write("{\n")
+                first = True
+                kept = 0
+
+        for new_key, row in new_rows.items():
+            f.write(("" if first else ",\n") + _entry(new_key, row, indent))
+            first = False
+        f.write("\n}\n")
+
+    return kept, len(new_rows)
@@ -10,6 +10,12 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 
+from browser_profile import apply_profile
+from checkpoint import Checkpoint
+from extraction_pipeline import ExtractionPipeline
+from extractors import extract_magnit
+from metrics import RunMetrics
+
 
 load_dotenv()
 
@@ -18,21 +24,25 @@ MAGNIT_PASSWORD = os.getenv("MAGNIT_PASSWORD")
 
 OUTPUT_FILE = f"magnit_global_{datetime.now().strftime('%Y-%m-%d')}.json"
 
+metrics = RunMetrics("magnit_global")
+
+PLAN_NEEDS_DRIVER = False
+
 
 # ----------------------------------------
 # Driver setup (compatible with GitHub Actions)
 # ----------------------------------------
 def get_driver():
     options = Options()
-    options.add_argument("--headless=new")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--window-size=1920,1080")
-
-    driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
-        options=options
-    )
+    # Fresh profile: the flow below expects the login form on every run
+    apply_profile(options)
+
+    with metrics.timer("browser_start"):
+        driver = webdriver.Chrome(
+            service=Service(ChromeDriverManager().install()),
+            options=options
+        )
+    metrics.inc("browser_starts")
     return driver
 
 
@@ -44,99 +54,120 @@ def go_to_main_page(driver):
     time.sleep(4)
 
 
-def scrape(driver, results):
+def scrape(driver, pipeline, checkpoint=None):
     for i in range(1, 50):
+        row_xpath = f'//*[@id="jobrequestTable"]/div/div/datatable-body/datatable-scroller/div/datatable-row-wrapper[{i}]'
         try:
-            row_xpath = f'//*[@id="jobrequestTable"]/div/div/datatable-body/datatable-scroller/div/datatable-row-wrapper[{i}]'
             row_element = driver.find_element(By.XPATH, row_xpath)
-            driver.execute_script("arguments[0].scrollIntoView();", row_element)
-            row_element.click()
-            time.sleep(2)
-
-            # Extract fields
-            UID = driver.find_element(By.XPATH, f'{row_xpath}/datatable-body-row/div/datatable-body-cell[1]/div/span').text
-            title = driver.find_element(By.XPATH, '//*[@id="list-nieuw-item-1"]/div[2]/h3').text
-
-            start_date = "".join([
-                driver.find_element(By.XPATH, '//*[@id="list-nieuw-item-1"]/div[2]/div/div[2]/app-period/div/div[2]/div[1]/div[1]').text,
-                driver.find_element(By.XPATH, '//*[@id="list-nieuw-item-1"]/div[2]/div/div[2]/app-period/div/div[2]/div[1]/div[2]').text,
-                driver.find_element(By.XPATH, '//*[@id="list-nieuw-item-1"]/div[2]/div/div[2]/app-period/div/div[2]/div[1]/div[3]').text
-            ])
-
-            end_date = "".join([
-                driver.find_element(By.XPATH, '//*[@id="list-nieuw-item-1"]/div[2]/div/div[2]/app-period/div/div[2]/div[2]/div[1]').text,
-                driver.find_element(By.XPATH, '//*[@id="list-nieuw-item-1"]/div[2]/div/div[2]/app-period/div/div[2]/div[2]/div[2]').text,
-                driver.find_element(By.XPATH, '//*[@id="list-nieuw-item-1"]/div[2]/div/div[2]/app-period/div/div[2]/div[2]/div[3]').text
-            ])
-
-            hours = driver.find_element(By.XPATH, '//app-icon-label/div/div[2]/div[2]/span').text
-            deadline_application = driver.find_element(By.XPATH, '(//app-icon-label/div/div[2]/div[2]/span)[2]').text
-            experience = driver.find_element(By.XPATH, '(//app-icon-label/div/div[2]/div[2]/span)[4]').text
-            max_hourly_pay = driver.find_element(By.XPATH, '(//app-icon-label/div/div[2]/div[2]/span)[3]').text
-            location = driver.find_element(By.XPATH, '(//app-icon-label/div/div[2]/div[2]/span)[1]').text
-
-            vacancy_text = driver.find_element(By.XPATH, '//*[@id="list-nieuw-item-1"]/div[3]/div[1]/pre').text
-
-            results.append({
-                "UID": UID,
-                "titel": title,
-                "start datum": start_date,
-                "eind datum": end_date,
-                "deadline aanvraag": deadline_application,
-                "locatie": location,
-                "uren per week": hours,
-                "ervaring in jaren": experience,
-                "max uur tarief": max_hourly_pay,
-                "vacature tekst": vacancy_text
-            })
-
         except:
             continue
+        metrics.inc("vacancies_found")
+
+        # The UID is in the row itself, so finished vacancies are skipped without opening them
+        uid = None
+        if checkpoint:
+            try:
+                uid = driver.find_element(
+                    By.XPATH, f'{row_xpath}/datatable-body-row/div/datatable-body-cell[1]/div/span'
+                ).text.strip()
+            except:
+                pass
+            if uid and checkpoint.is_done(uid):
+                continue
 
-    return results
+        try:
+            with metrics.timer("vacancy_load"):
+                driver.execute_script("arguments[0].scrollIntoView();", row_element)
+                row_element.click()
+                time.sleep(2)
+                page_source = driver.page_source
+
+            # Fields are extracted from the snapshot in a worker process
+            metrics.add_bytes(page_source)
+            future = pipeline.submit(extract_magnit, page_source, row_xpath)
+            if checkpoint and uid:
+                checkpoint.track(future, uid)
 
+        except:
+            metrics.inc("vacancies_failed")
+            continue
 
-# ----------------------------------------
-# Main
-# ----------------------------------------
-def main():
-    driver = get_driver()
 
-    go_to_main_page(driver)
+def login(driver):
+    with metrics.timer("login"):
+        go_to_main_page(driver)
 
-    # Login
-    driver.find_element(By.ID, 'signInName').send_keys(MAGNIT_EMAIL)
-    driver.find_element(By.XPATH, '//input[@type="password"]').send_keys(MAGNIT_PASSWORD)
-    driver.find_element(By.ID, 'continue').click()
-    time.sleep(8)
+        driver.find_element(By.ID, 'signInName').send_keys(MAGNIT_EMAIL)
+        driver.find_element(By.XPATH, '//input[@type="password"]').send_keys(MAGNIT_PASSWORD)
+        driver.find_element(By.ID, 'continue').click()
+        time.sleep(8)
 
-    # Click through to jobs
-    driver.find_element(By.XPATH, "//app-user-button/a").click()
-    time.sleep(1)
-    driver.find_element(By.XPATH, "//app-user-identity[1]/a").click()
-    time.sleep(5)
 
-    driver.find_element(By.XPATH, "//app-job-requests-dashboard-widget//a").click()
-    time.sleep(8)
+def open_section(driver, unit):
+    """Switches to an app-user-identity and opens its job requests."""
+    with metrics.timer("listing_load"):
+        driver.find_element(By.XPATH, "//app-user-button/a").click()
+        time.sleep(1)
+        driver.find_element(By.XPATH, f"//app-user-identity[{unit['identity']}]/a").click()
+        time.sleep(5)
+        driver.find_element(By.XPATH, unit["widget"]).click()
+        time.sleep(unit["wait"])
 
-    results = scrape(driver, [])
 
-    # Switch to second section
-    driver.find_element(By.XPATH, "//app-user-button/a").click()
-    time.sleep(1)
-    driver.find_element(By.XPATH, "//app-user-identity[2]/a").click()
-    time.sleep(5)
-    driver.find_element(By.XPATH, "//app-job-requests-dashboard-widget//a[1]").click()
-    time.sleep(5)
+# ----------------------------------------
+# Plan / execute / save (see sharding.py)
+# ----------------------------------------
+def plan(driver=None):
+    """The two identity sections are the units; both are fixed, no browser needed."""
+    return [
+        {"key": "section-1", "identity": 1, "widget": "//app-job-requests-dashboard-widget//a", "wait": 8},
+        {"key": "section-2", "identity": 2, "widget": "//app-job-requests-dashboard-widget//a[1]", "wait": 5},
+    ]
+
+
+def execute(driver, units, pipeline, checkpoint=None):
+    if checkpoint:
+        units = [unit for unit in units if not checkpoint.is_done(unit["key"])]
+    if not units:
+        return
+    login(driver)
+    for unit in units:
+        open_section(driver, unit)
+        scrape(driver, pipeline, checkpoint)
+        if checkpoint:
+            # A section only counts as done once all its rows are on disk
+            checkpoint.wait_pending()
+            checkpoint.mark_done(unit["key"])
+
+
+def save(rows, output_file=OUTPUT_FILE):
+    df = pd.DataFrame(rows).drop_duplicates("UID").set_index("UID")
+    with metrics.timer("save"):
+        df.to_json(output_file, indent=4)
+
+    print("Saved:", output_file)
+    metrics.observe_rows(df.reset_index().to_dict("records"))
 
-    results = scrape(driver, results)
 
-    driver.quit()
+# ----------------------------------------
+# Main
+# ----------------------------------------
+def main():
+    driver = get_driver()
+    pipeline = ExtractionPipeline()
+    checkpoint = Checkpoint("magnit_global")
 
-    df = pd.DataFrame(results).drop_duplicates("UID").set_index("UID")
-    df.to_json(OUTPUT_FILE, indent=4)
+    execute(driver, plan(), pipeline, checkpoint)
 
-    print("Saved:", OUTPUT_FILE)
+    driver.quit()
+    with metrics.timer("extract_wait"):
+        results = checkpoint.previous_rows + pipeline.results()
+    metrics.inc("vacancies_failed", pipeline.failed)
+    pipeline.close()
+
+    save(results)
+    checkpoint.close(completed=True)
+    metrics.write()
 
 
 if __name__ == "__main__":
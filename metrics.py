@@ -0,0 +1,152 @@
+import os
+import json
+import time
+import threading
+from datetime import datetime
+from contextlib import contextmanager
+
+from json_store import atomic_write
+
+METRICS_DIR = os.getenv("METRICS_DIR", "metrics")
+
+# Seconds; vacancy pages take 1-10s, logins and infinite scroll up to minutes
+LATENCY_BUCKETS = [0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60, 120, 300]
+
+COUNTERS = {
+    "vacancies_found": "Vacancies (links/rows/cards) found on listing pages",
+    "vacancies_scraped": "Vacancies scraped and saved",
+    "vacancies_failed": "Vacancies that failed to load or extract",
+    "bytes_downloaded": "Bytes of HTML taken from the browser",
+    "browser_starts": "Browser (re)starts",
+}
+
+
+# ----------------------------------------
+# Run metrics
+# ----------------------------------------
+class RunMetrics:
+    """
+    Collects metrics for one scraper run and writes them at the end as a
+    Prometheus textfile (metrics/<source>.prom, for node_exporter's textfile
+    collector) plus a dated JSON file for trending.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.started = time.time()
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.histograms = {}
+        self.fill_rates = {}
+        self.extra = {}
+        self.lock = threading.Lock()
+
+    def inc(self, name, value=1):
+        with self.lock:
+            self.counters[name] += value
+
+    def add_bytes(self, page_source):
+        self.inc("bytes_downloaded", len(page_source.encode("utf-8")))
+
+    def observe(self, stage, seconds):
+        with self.lock:
+            hist = self.histograms.setdefault(
+                stage, {"buckets": [0] * len(LATENCY_BUCKETS), "count": 0, "sum": 0.0}
+            )
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    hist["buckets"][i] += 1
+            hist["count"] += 1
+            hist["sum"] += seconds
+
+    @contextmanager
+    def timer(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def observe_rows(self, rows):
+        """Sets vacancies_scraped and the share of non-empty values per field."""
+        rows = list(rows)
+        self.counters["vacancies_scraped"] = len(rows)
+        fields = {f for row in rows for f in row}
+        self.fill_rates = {
+            f: sum(1 for row in rows if row.get(f) not in (None, "", [])) / len(rows)
+            for f in sorted(fields)
+        } if rows else {}
+
+    # ----------------------------------------
+    # Output
+    # ----------------------------------------
+    def as_dict(self):
+        return {
+            "source": self.source,
+            "started": datetime.fromtimestamp(self.started).isoformat(timespec="seconds"),
+            "duration_seconds": round(time.time() - self.started, 3),
+            "counters": dict(self.counters, browser_restarts=max(0, self.counters["browser_starts"] - 1)),
+            "stages": {
+                stage: {
+                    "count": h["count"],
+                    "sum_seconds": round(h["sum"], 3),
+                    "buckets": dict(zip(map(str, LATENCY_BUCKETS), h["buckets"])),
+                }
+                for stage, h in self.histograms.items()
+            },
+            "field_fill_rates": {f: round(r, 4) for f, r in self.fill_rates.items()},
+            **self.extra,
+        }
+
+    def to_prometheus(self):
+        src = f'source="{self.source}"'
+        lines = []
+
+        for name, help_text in COUNTERS.items():
+            metric = f"scraper_{name}_total"
+            lines += [f"# HELP {metric} {help_text}.", f"# TYPE {metric} counter",
+                      f"{metric}{{{src}}} {self.counters[name]}"]
+
+        restarts = max(0, self.counters["browser_starts"] - 1)
+        lines += ["# HELP scraper_browser_restarts Browser starts beyond the first one.",
+                  "# TYPE scraper_browser_restarts gauge",
+                  f"scraper_browser_restarts{{{src}}} {restarts}"]
+
+        lines += ["# HELP scraper_stage_duration_seconds Duration of scrape stages.",
+                  "# TYPE scraper_stage_duration_seconds histogram"]
+        for stage, h in sorted(self.histograms.items()):
+            labels = f'{src},stage="{stage}"'
+            for bound, count in zip(LATENCY_BUCKETS, h["buckets"]):
+                lines.append(f'scraper_stage_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'scraper_stage_duration_seconds_bucket{{{labels},le="+Inf"}} {h["count"]}')
+            lines.append(f"scraper_stage_duration_seconds_sum{{{labels}}} {h['sum']:.6f}")
+            lines.append(f"scraper_stage_duration_seconds_count{{{labels}}} {h['count']}")
+
+        lines += ["# HELP scraper_field_fill_ratio Share of scraped vacancies with a non-empty field.",
+                  "# TYPE scraper_field_fill_ratio gauge"]
+        for field, rate in sorted(self.fill_rates.items()):
+            field = field.replace("\\", "\\\\").replace('"', '\\"')
+            lines.append(f'scraper_field_fill_ratio{{{src},field="{field}"}} {rate:.4f}')
+
+        lines += ["# HELP scraper_run_duration_seconds Wall time of the run.",
+                  "# TYPE scraper_run_duration_seconds gauge",
+                  f"scraper_run_duration_seconds{{{src}}} {time.time() - self.started:.3f}",
+                  "# HELP scraper_last_run_timestamp_seconds Start of the last run.",
+                  "# TYPE scraper_last_run_timestamp_seconds gauge",
+                  f"scraper_last_run_timestamp_seconds{{{src}}} {self.started:.0f}"]
+        return "\n".join(lines) + "\n"
+
+    def write(self, directory=METRICS_DIR):
+        """Writes <source>.prom and <source>_<date>.json; returns both paths."""
+        os.makedirs(directory, exist_ok=True)
+        prom_path = os.path.join(directory, f"{self.source}.prom")
+        json_path = os.path.join(
+            directory, f"{self.source}_{datetime.fromtimestamp(self.started).strftime('%Y-%m-%d')}.json"
+        )
+        # Atomic, so the textfile collector never reads a half-written file, and
+        # world-readable, since node_exporter usually runs as another user
+        with atomic_write(prom_path, mode=0o644) as f:
+            f.write(self.to_prometheus())
+        with atomic_write(json_path) as f:
+            json.dump(self.as_dict(), f, indent=4)
+        print(f"📊 Metrics: {prom_path}, {json_path}")
+        return prom_path, json_path
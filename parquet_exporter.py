@@ -0,0 +1,130 @@
+import os
+import sys
+import shutil
+import argparse
+
+from snapshots import FIELDS, LIST_FIELDS, SNAPSHOT_DIR, iter_records, list_snapshots, parse_snapshot_name
+
+PARQUET_DIR = "parquet"
+PARTITION_COLS = ["source", "scrape_date"]
+
+# Short, repetitive strings compress well as dictionaries; free text does not
+DICTIONARY_COLS = ["uid", "titel", "organisatie", "plaats", "uren", "start",
+                   "eind", "deadline", "tarief", "url"]
+
+
+def arrow_schema():
+    """
+    Explicit schema so partitions without e.g. any "eisen" still get
+    list<string>. Built on demand: pandas/pyarrow are only imported once
+    something is actually exported, not when the module is loaded.
+    """
+    import pyarrow as pa
+
+    return pa.schema(
+        [(f, pa.list_(pa.string()) if f in LIST_FIELDS else pa.string()) for f in FIELDS]
+        + [(c, pa.string()) for c in PARTITION_COLS]
+    )
+
+
+# ----------------------------------------
+# Export
+# ----------------------------------------
+def snapshot_partition(path, source=None, scrape_date=None):
+    """(source, scrape_date) for a file: given values win, the file name is the fallback."""
+    parsed = parse_snapshot_name(path) or (None, None)
+    source, scrape_date = source or parsed[0], scrape_date or parsed[1]
+    if not source or not scrape_date:
+        raise ValueError(f"{path} heeft geen <source>_<date>.json naam, geef --source en --date op")
+    return source, scrape_date
+
+
+def snapshot_frame(path, source, scrape_date):
+    """Loads one snapshot into a DataFrame with the unified schema."""
+    import pandas as pd
+
+    df = pd.DataFrame(list(iter_records(path, source)), columns=FIELDS)
+    df = df.drop_duplicates("uid")
+    df["source"] = source
+    df["scrape_date"] = scrape_date
+    return df
+
+
+def write_partition(df, root=PARQUET_DIR):
+    """Writes a frame to root/source=.../scrape_date=..., replacing that partition."""
+    df.to_parquet(
+        root,
+        engine="pyarrow",
+        index=False,
+        schema=arrow_schema(),
+        partition_cols=PARTITION_COLS,
+        compression="zstd",
+        use_dictionary=DICTIONARY_COLS,
+        existing_data_behavior="delete_matching",
+    )
+
+
+def partition_dir(root, source, scrape_date):
+    return os.path.join(root, f"source={source}", f"scrape_date={scrape_date}")
+
+
+def export_snapshot(path, root=PARQUET_DIR, source=None, scrape_date=None):
+    try:
+        source, scrape_date = snapshot_partition(path, source, scrape_date)
+    except ValueError as e:
+        print("[!]", e)
+        return 0
+
+    df = snapshot_frame(path, source, scrape_date)
+    if df.empty:
+        # An empty snapshot still replaces what an earlier export wrote there
+        stale = partition_dir(root, source, scrape_date)
+        if os.path.isdir(stale):
+            shutil.rmtree(stale)
+            print("Leeg, oude partitie verwijderd:", stale)
+        else:
+            print("Overgeslagen (leeg):", path)
+        return 0
+    write_partition(df, root)
+    print(f"Exported {len(df)} rows: {path} -> {root}")
+    return len(df)
+
+
+def backfill(directory=SNAPSHOT_DIR, root=PARQUET_DIR):
+    """
+    (Re)exports every JSON snapshot found in directory. Idempotent: each
+    file maps to one partition, circle8.json to scrape_date=cumulative.
+    """
+    total = 0
+    for _, _, path in list_snapshots(directory):
+        total += export_snapshot(path, root)
+    print(f"Backfill klaar: {total} rows in {root}")
+    return total
+
+
+# ----------------------------------------
+# Main
+# ----------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export JSON snapshots to partitioned Parquet.")
+    parser.add_argument("files", nargs="*", help="Snapshot files to export")
+    parser.add_argument("--backfill", action="store_true", help="Export all snapshots in --dir")
+    parser.add_argument("--dir", default=SNAPSHOT_DIR, help="Directory with JSON snapshots")
+    parser.add_argument("--out", default=PARQUET_DIR, help="Parquet dataset root")
+    parser.add_argument("--source", help="Source of files not named <source>_<date>.json")
+    parser.add_argument("--date", help="Scrape date of files not named <source>_<date>.json")
+    args = parser.parse_args(argv)
+
+    if args.backfill:
+        backfill(args.dir, args.out)
+    elif args.files:
+        for path in args.files:
+            export_snapshot(path, args.out, args.source, args.date)
+    else:
+        parser.print_help()
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
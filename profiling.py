@@ -0,0 +1,191 @@
+import os
+import sys
+import time
+import json
+import pstats
+import runpy
+import cProfile
+import argparse
+import threading
+from collections import Counter, defaultdict
+
+PROFILE_DIR = "profiles"
+
+
+# ----------------------------------------
+# WebDriver command timing
+# ----------------------------------------
+class WebDriverTimer:
+    """
+    Wraps selenium's WebDriver.execute, which every driver and element call
+    goes through, and records time per command (get, findElement,
+    executeScript, clickElement, getPageSource, ...). The command currently
+    running per thread is also exposed to the sampler.
+    """
+
+    def __init__(self):
+        self.stats = defaultdict(lambda: {"count": 0, "total_s": 0.0, "max_s": 0.0})
+        self.current = {}
+        self._original = None
+
+    def install(self):
+        try:
+            from selenium.webdriver.remote.webdriver import WebDriver
+        except ImportError:
+            return False
+
+        original = self._original = WebDriver.execute
+        timer = self
+
+        def execute(driver, driver_command, params=None):
+            tid = threading.get_ident()
+            timer.current[tid] = driver_command
+            start = time.perf_counter()
+            try:
+                return original(driver, driver_command, params)
+            finally:
+                elapsed = time.perf_counter() - start
+                timer.current.pop(tid, None)
+                stat = timer.stats[driver_command]
+                stat["count"] += 1
+                stat["total_s"] += elapsed
+                stat["max_s"] = max(stat["max_s"], elapsed)
+
+        WebDriver.execute = execute
+        return True
+
+    def uninstall(self):
+        if self._original:
+            from selenium.webdriver.remote.webdriver import WebDriver
+            WebDriver.execute = self._original
+
+    def summary(self):
+        return {
+            cmd: dict(s, mean_s=s["total_s"] / s["count"])
+            for cmd, s in sorted(self.stats.items(), key=lambda kv: -kv[1]["total_s"])
+        }
+
+
+# ----------------------------------------
+# Sampling profiler (collapsed stacks for flamegraphs)
+# ----------------------------------------
+class StackSampler(threading.Thread):
+    """
+    Samples the stacks of all threads every `interval` seconds and counts
+    them in the collapsed format ("a;b;c 42") read by flamegraph.pl,
+    speedscope and inferno. A running WebDriver command is added as a
+    leaf frame "webdriver:<command>".
+    """
+
+    def __init__(self, interval=0.005, webdriver_timer=None):
+        super().__init__(name="stack-sampler", daemon=True)
+        self.interval = interval
+        self.webdriver_timer = webdriver_timer
+        self.samples = Counter()
+        self._stop_event = threading.Event()
+
+    @staticmethod
+    def _label(code):
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def run(self):
+        own = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for tid, frame in sys._current_frames().items():
+                if tid == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    # Everything below runpy's _run_code is this runner, not the scraper
+                    if frame.f_code.co_name == "_run_code" and "runpy" in frame.f_code.co_filename:
+                        break
+                    stack.append(self._label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(names.get(tid, str(tid)))
+                stack.reverse()
+                if self.webdriver_timer and tid in self.webdriver_timer.current:
+                    stack.append(f"webdriver:{self.webdriver_timer.current[tid]}")
+                self.samples[";".join(stack)] += 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+    def write_collapsed(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+# ----------------------------------------
+# Runner
+# ----------------------------------------
+def profile_script(script, args, out_dir=PROFILE_DIR, mode="both", interval=0.005, top=25):
+    """Runs script as __main__ under the profilers and writes the results to out_dir."""
+    os.makedirs(out_dir, exist_ok=True)
+    name = os.path.splitext(os.path.basename(script))[0]
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    base = os.path.join(out_dir, f"{name}_{stamp}")
+
+    webdriver_timer = WebDriverTimer()
+    webdriver_timer.install()
+    sampler = StackSampler(interval, webdriver_timer) if mode in ("sample", "both") else None
+    profiler = cProfile.Profile() if mode in ("cprofile", "both") else None
+
+    sys.argv = [script] + list(args)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(script)))
+
+    exit_code = 0
+    start = time.perf_counter()
+    if sampler:
+        sampler.start()
+    if profiler:
+        profiler.enable()
+    try:
+        runpy.run_path(script, run_name="__main__")
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    finally:
+        if profiler:
+            profiler.disable()
+        if sampler:
+            sampler.stop()
+        webdriver_timer.uninstall()
+        wall = time.perf_counter() - start
+
+        print(f"\n⏱  {script}: {wall:.1f}s wall time")
+        if profiler:
+            profiler.dump_stats(base + ".prof")
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(top)
+            print("cProfile:", base + ".prof  (snakeviz / flameprof / gprof2dot)")
+        if sampler:
+            sampler.write_collapsed(base + ".collapsed")
+            print("Collapsed stacks:", base + ".collapsed  (flamegraph.pl / speedscope)")
+
+        summary = webdriver_timer.summary()
+        with open(base + ".webdriver.json", "w", encoding="utf-8") as f:
+            json.dump({"wall_s": wall, "commands": summary}, f, indent=4)
+        if summary:
+            print(f"{'WebDriver command':<28} {'count':>7} {'total':>9} {'mean':>8} {'max':>8}")
+            for cmd, s in summary.items():
+                print(f"{cmd:<28} {s['count']:>7} {s['total_s']:>8.2f}s {s['mean_s']:>7.3f}s {s['max_s']:>7.2f}s")
+    return exit_code
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Profile any scraper entry point, e.g. python profiling.py striive_scraper.py"
+    )
+    parser.add_argument("script", help="Scraper script to run as __main__")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="Arguments for the script")
+    parser.add_argument("--out", default=PROFILE_DIR, help="Output directory")
+    parser.add_argument("--mode", choices=["both", "cprofile", "sample"], default="both")
+    parser.add_argument("--interval", type=float, default=0.005, help="Sampling interval in seconds")
+    parser.add_argument("--top", type=int, default=25, help="Functions to print from cProfile")
+    args = parser.parse_args(argv)
+    return profile_script(args.script, args.args, args.out, args.mode, args.interval, args.top)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
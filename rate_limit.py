@@ -0,0 +1,228 @@
+import time
+import threading
+from urllib.parse import urlparse
+
+# ----------------------------------------
+# Per-site politeness budgets
+# ----------------------------------------
+# rate/min_rate/max_rate in requests per second. Start conservative; the
+# scheduler speeds up while the site answers quickly and halves on blocks.
+# Every scraper drives one browser sequentially, so a host never has more
+# than one request in flight; only the rate adapts.
+SITE_BUDGETS = {
+    "nl.indeed.com": {"rate": 0.3, "min_rate": 0.05, "max_rate": 1.0, "target_latency": 3.0},
+    "www.circle8.nl": {"rate": 0.5, "min_rate": 0.05, "max_rate": 2.0, "target_latency": 3.0},
+    "www.bluetrail.nl": {"rate": 1.0, "min_rate": 0.1, "max_rate": 4.0, "target_latency": 2.0},
+}
+DEFAULT_BUDGET = {"rate": 0.5, "min_rate": 0.05, "max_rate": 2.0, "target_latency": 3.0}
+
+BLOCK_STATUSES = {403, 429, 503}
+
+# Only markers of the challenge/captcha pages themselves (Cloudflare on Indeed
+# and Circle8, DataDome, Indeed's hCaptcha page). Generic text such as
+# "access denied" or Cloudflare's "challenge-platform" detection script also
+# shows up on ordinary pages and would halve the rate for nothing.
+BLOCK_MARKERS = [
+    "cf-chl",
+    "_cf_chl_opt",
+    "captcha-delivery.com",
+    "just a moment...",
+    "additional verification required",
+]
+
+MAX_COOLDOWN = 300
+
+# Runs in the browser, so checking for a block page costs one small round trip
+# instead of transferring the whole page_source
+BLOCK_PROBE = """(markers) => {
+    const head = (document.title + "\\n" + document.documentElement.outerHTML.slice(0, 20000)).toLowerCase();
+    return markers.some((m) => head.includes(m));
+}"""
+
+
+def is_blocked(page_source="", title="", status=None):
+    """True if a response looks like a rate limit, ban or captcha page."""
+    if status in BLOCK_STATUSES:
+        return True
+    haystack = f"{title}\n{page_source[:20000]}".lower()
+    return any(marker in haystack for marker in BLOCK_MARKERS)
+
+
+def driver_is_blocked(driver):
+    """is_blocked() for the page a selenium driver has open, evaluated in the browser."""
+    return bool(driver.execute_script(f"return ({BLOCK_PROBE})(arguments[0]);", BLOCK_MARKERS))
+
+
+# ----------------------------------------
+# Token bucket with adaptive rate (AIMD)
+# ----------------------------------------
+class HostBudget:
+    def __init__(self, host, rate, min_rate, max_rate, target_latency):
+        self.host = host
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.target_latency = target_latency
+
+        self.in_flight = 0
+        self.tokens = 1.0
+        self.updated = time.monotonic()
+        self.cooldown_until = 0.0
+        self.consecutive_blocks = 0
+        self.successes = 0
+        self.requests = 0
+        self.blocks = 0
+        self.cond = threading.Condition()
+
+    def _refill(self, now):
+        # One token at most: no bursts after an idle period
+        self.tokens = min(1.0, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """Blocks until a token, the cooldown and the request in flight allow a request."""
+        with self.cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self.cooldown_until:
+                    wait = self.cooldown_until - now
+                elif self.in_flight:
+                    wait = None
+                elif self.tokens < 1:
+                    wait = (1 - self.tokens) / self.rate
+                else:
+                    self.tokens -= 1
+                    self.in_flight += 1
+                    self.requests += 1
+                    return
+                self.cond.wait(wait)
+
+    def release(self, latency, blocked, failed=False):
+        """
+        blocked: a block/captcha page, halves the rate and cools down.
+        failed:  the request raised (e.g. a timeout); slows down like a slow
+                 response and never counts as a success.
+        """
+        with self.cond:
+            self.in_flight -= 1
+            if failed:
+                self.successes = 0
+                self.rate = max(self.min_rate, self.rate * 0.8)
+            elif blocked:
+                self.blocks += 1
+                self.consecutive_blocks += 1
+                self.successes = 0
+                self.rate = max(self.min_rate, self.rate / 2)
+                cooldown = min(MAX_COOLDOWN, 10 * 2 ** (self.consecutive_blocks - 1))
+                self.cooldown_until = time.monotonic() + cooldown
+                print(f"[!] {self.host}: blokkade gedetecteerd, {cooldown}s pauze, rate -> {self.rate:.2f}/s")
+            else:
+                self.consecutive_blocks = 0
+                self.successes += 1
+                if latency < self.target_latency:
+                    self.rate = min(self.max_rate, self.rate + 0.05 * self.max_rate)
+                elif latency > 2 * self.target_latency:
+                    self.rate = max(self.min_rate, self.rate * 0.8)
+            self.cond.notify_all()
+
+    def stats(self):
+        return {
+            "rate": round(self.rate, 3),
+            "requests": self.requests,
+            "blocks": self.blocks,
+        }
+
+
+class Scheduler:
+    """Hands out request slots per host according to SITE_BUDGETS."""
+
+    def __init__(self, budgets=None):
+        self.budgets = dict(SITE_BUDGETS if budgets is None else budgets)
+        self.hosts = {}
+        self.lock = threading.Lock()
+
+    def budget(self, url):
+        host = urlparse(url).netloc or url
+        with self.lock:
+            if host not in self.hosts:
+                config = self.budgets.get(host, DEFAULT_BUDGET)
+                self.hosts[host] = HostBudget(host, **config)
+            return self.hosts[host]
+
+    def acquire(self, url):
+        budget = self.budget(url)
+        budget.acquire()
+        return budget
+
+    def stats(self):
+        return {host: budget.stats() for host, budget in self.hosts.items()}
+
+
+SCHEDULER = Scheduler()
+
+
+# ----------------------------------------
+# Helpers for the scrapers
+# ----------------------------------------
+def polite_get(driver, url, scheduler=SCHEDULER, retries=2):
+    """
+    driver.get(url) within the host's budget. On a block/captcha page the
+    host cools down and the load is retried. Returns False if still blocked.
+    """
+    for _ in range(retries + 1):
+        budget = scheduler.acquire(url)
+        start = time.monotonic()
+        try:
+            driver.get(url)
+            blocked = driver_is_blocked(driver)
+        except Exception:
+            budget.release(time.monotonic() - start, blocked=False, failed=True)
+            raise
+        budget.release(time.monotonic() - start, blocked)
+        if not blocked:
+            return True
+    return False
+
+
+def polite_action(url, action, check=None, scheduler=SCHEDULER):
+    """
+    Runs action() (e.g. a click that triggers a request) within the budget
+    of url's host. check() returns True if the result is a block page.
+
+    check() also runs when action() raises: a captcha usually shows up as
+    a wait that times out, and must still count as a block, not a failure.
+    """
+    budget = scheduler.acquire(url)
+    start = time.monotonic()
+    try:
+        result = action()
+        blocked = bool(check and check())
+    except Exception:
+        try:
+            blocked = bool(check and check())
+        except Exception:
+            blocked = False
+        budget.release(time.monotonic() - start, blocked=blocked, failed=not blocked)
+        raise
+    budget.release(time.monotonic() - start, blocked)
+    return result
+
+
+def polite_goto(page, url, scheduler=SCHEDULER, retries=2, **goto_kwargs):
+    """Playwright version of polite_get; also uses the HTTP status of the response."""
+    response = None
+    for _ in range(retries + 1):
+        budget = scheduler.acquire(url)
+        start = time.monotonic()
+        try:
+            response = page.goto(url, **goto_kwargs)
+            status = response.status if response else None
+            blocked = status in BLOCK_STATUSES or bool(page.evaluate(BLOCK_PROBE, BLOCK_MARKERS))
+        except Exception:
+            budget.release(time.monotonic() - start, blocked=False, failed=True)
+            raise
+        budget.release(time.monotonic() - start, blocked)
+        if not blocked:
+            break
+    return response
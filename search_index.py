@@ -0,0 +1,237 @@
+import os
+import re
+import sys
+import time
+import sqlite3
+import argparse
+
+from snapshots import CIRCLE8_DATE, SNAPSHOT_DIR, iter_records, list_snapshots, parse_snapshot_name, record_hash
+
+try:
+    import snowballstemmer
+    _stemmer = snowballstemmer.stemmer("dutch")
+except ImportError:
+    _stemmer = None
+
+INDEX_FILE = "vacatures_index.db"
+
+# Stored in the index: stemmed and unstemmed terms never match each other
+ANALYZER = "snowball-dutch" if _stemmer else "unicode61-lower"
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id           INTEGER PRIMARY KEY,
+    doc_key      TEXT UNIQUE NOT NULL,
+    source       TEXT NOT NULL,
+    uid          TEXT NOT NULL,
+    titel        TEXT,
+    url          TEXT,
+    content_hash TEXT NOT NULL,
+    first_seen   TEXT NOT NULL,
+    last_seen    TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS indexed_files (
+    path  TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size  INTEGER NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS docs_fts USING fts5(
+    titel, body, tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+
+# ----------------------------------------
+# Dutch tokenisation
+# ----------------------------------------
+def analyze(text):
+    """Lowercases, tokenises and stems text (Dutch snowball stemmer)."""
+    tokens = TOKEN_PATTERN.findall((text or "").lower())
+    if _stemmer:
+        tokens = _stemmer.stemWords(tokens)
+    return " ".join(tokens)
+
+
+def build_query(text):
+    """Turns free text into an FTS5 AND-query over the stemmed terms."""
+    terms = analyze(text).split()
+    return " ".join(f'"{t}"' for t in terms)
+
+
+# ----------------------------------------
+# Index maintenance
+# ----------------------------------------
+def connect(path=INDEX_FILE):
+    """Opens the index; refuses one built with another analyzer (e.g. without snowballstemmer)."""
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    row = conn.execute("SELECT value FROM meta WHERE key = 'analyzer'").fetchone()
+    if row is None:
+        with conn:
+            conn.execute("INSERT INTO meta (key, value) VALUES ('analyzer', ?)", (ANALYZER,))
+    elif row[0] != ANALYZER:
+        conn.close()
+        raise RuntimeError(
+            f"{path} is gebouwd met analyzer {row[0]}, deze omgeving gebruikt {ANALYZER}. "
+            "Installeer snowballstemmer of bouw opnieuw met: python search_index.py index --rebuild"
+        )
+    return conn
+
+
+def index_records(conn, source, scrape_date, records):
+    """Upserts records; only documents whose content changed are re-tokenised."""
+    added = changed = 0
+    for record in records:
+        doc_key = f"{source}:{record['uid']}"
+        digest = record_hash(record)
+        row = conn.execute(
+            "SELECT id, content_hash, first_seen, last_seen FROM docs WHERE doc_key = ?",
+            (doc_key,),
+        ).fetchone()
+
+        if row and row[1] == digest:
+            conn.execute(
+                "UPDATE docs SET first_seen = min(first_seen, ?), last_seen = max(last_seen, ?) WHERE id = ?",
+                (scrape_date, scrape_date, row[0]),
+            )
+            continue
+
+        body = "\n".join([record["text"]] + record["eisen"] + record["wensen"] + record["competenties"])
+        if row:
+            doc_id = row[0]
+            conn.execute(
+                "UPDATE docs SET titel = ?, url = ?, content_hash = ?, "
+                "first_seen = min(first_seen, ?), last_seen = max(last_seen, ?) WHERE id = ?",
+                (record["titel"], record["url"], digest, scrape_date, scrape_date, doc_id),
+            )
+            conn.execute("DELETE FROM docs_fts WHERE rowid = ?", (doc_id,))
+            changed += 1
+        else:
+            doc_id = conn.execute(
+                "INSERT INTO docs (doc_key, source, uid, titel, url, content_hash, first_seen, last_seen) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (doc_key, source, record["uid"], record["titel"], record["url"], digest, scrape_date, scrape_date),
+            ).lastrowid
+            added += 1
+
+        conn.execute(
+            "INSERT INTO docs_fts (rowid, titel, body) VALUES (?, ?, ?)",
+            (doc_id, analyze(record["titel"]), analyze(body)),
+        )
+    return added, changed
+
+
+def index_file(path, conn=None, force=False, source=None):
+    """
+    Indexes one snapshot; files unchanged since the last run are skipped.
+    source is needed for files not named <source>_<date>.json; their
+    scrape date is the day they are indexed.
+    """
+    own_conn = conn is None
+    conn = conn or connect()
+    try:
+        stat = os.stat(path)
+        key = os.path.abspath(path)
+        seen = conn.execute("SELECT mtime, size FROM indexed_files WHERE path = ?", (key,)).fetchone()
+        if seen == (stat.st_mtime, stat.st_size) and not force:
+            return 0, 0
+
+        parsed = parse_snapshot_name(path) or (None, None)
+        source, scrape_date = source or parsed[0], parsed[1]
+        if not source:
+            print(f"[!] {path} heeft geen <source>_<date>.json naam, geef --source op")
+            return 0, 0
+        if scrape_date in (None, CIRCLE8_DATE):
+            # No scrape date in the file name; the day it is indexed is the closest
+            scrape_date = time.strftime("%Y-%m-%d")
+        with conn:
+            added, changed = index_records(conn, source, scrape_date, iter_records(path, source))
+            conn.execute(
+                "INSERT OR REPLACE INTO indexed_files (path, mtime, size) VALUES (?, ?, ?)",
+                (key, stat.st_mtime, stat.st_size),
+            )
+        print(f"[+] Zoekindex {path}: {added} nieuw, {changed} gewijzigd")
+        return added, changed
+    finally:
+        if own_conn:
+            conn.close()
+
+
+# ----------------------------------------
+# Querying
+# ----------------------------------------
+def search(conn, text, source=None, limit=20):
+    """Returns ranked hits as (source, uid, titel, url, first_seen, last_seen, score)."""
+    query = build_query(text)
+    if not query:
+        return []
+    sql = (
+        "SELECT d.source, d.uid, d.titel, d.url, d.first_seen, d.last_seen, "
+        "bm25(docs_fts, 5.0, 1.0) AS score "
+        "FROM docs_fts JOIN docs d ON d.id = docs_fts.rowid "
+        "WHERE docs_fts MATCH ?"
+    )
+    params = [query]
+    if source:
+        sql += " AND d.source = ?"
+        params.append(source)
+    sql += " ORDER BY score LIMIT ?"
+    params.append(limit)
+    return conn.execute(sql, params).fetchall()
+
+
+# ----------------------------------------
+# Main
+# ----------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Full-text search over scraped vacancies.")
+    parser.add_argument("--db", default=INDEX_FILE, help="SQLite index file")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_index = sub.add_parser("index", help="Index snapshot files (default: all in --dir)")
+    p_index.add_argument("files", nargs="*")
+    p_index.add_argument("--dir", default=SNAPSHOT_DIR)
+    p_index.add_argument("--force", action="store_true", help="Re-read unchanged files")
+    p_index.add_argument("--rebuild", action="store_true", help="Delete the index and build it from scratch")
+    p_index.add_argument("--source", help="Source of files not named <source>_<date>.json")
+
+    p_query = sub.add_parser("query", help="Search the index")
+    p_query.add_argument("text")
+    p_query.add_argument("--source")
+    p_query.add_argument("--limit", type=int, default=20)
+
+    args = parser.parse_args(argv)
+    if args.command == "index" and args.rebuild and os.path.exists(args.db):
+        os.remove(args.db)
+    try:
+        conn = connect(args.db)
+    except RuntimeError as e:
+        print("[!]", e)
+        return 1
+
+    if args.command == "index":
+        paths = args.files or [path for _, _, path in list_snapshots(args.dir)]
+        for path in paths:
+            index_file(path, conn, force=args.force, source=args.source)
+    else:
+        start = time.perf_counter()
+        hits = search(conn, args.text, args.source, args.limit)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        for source, uid, titel, url, first_seen, last_seen, score in hits:
+            print(f"{score:8.2f}  {source:<14} {first_seen} .. {last_seen}  {titel}  [{uid}]")
+            if url:
+                print(f"          {url}")
+        print(f"{len(hits)} hits in {elapsed_ms:.1f} ms")
+
+    conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+import os
+import sys
+import json
+import argparse
+import importlib
+import subprocess
+from datetime import datetime
+
+from json_store import atomic_write
+
+# Sources whose scraper module exposes plan / execute / save
+SHARDED_SOURCES = {
+    "bluetrail": "bluetrail_scraper",
+    "indeed": "indeed_scraper",
+    "magnit_global": "magnit_global_scraper",
+}
+SHARDS_DIR = "shards"
+
+
+# ----------------------------------------
+# Paths
+# ----------------------------------------
+def run_dir(source, date):
+    return os.path.join(SHARDS_DIR, f"{source}_{date}")
+
+
+def manifest_path(source, date):
+    return os.path.join(run_dir(source, date), "manifest.json")
+
+
+def part_path(source, date, index, count):
+    return os.path.join(run_dir(source, date), f"part-{index}-of-{count}.ndjson")
+
+
+def load_scraper(source):
+    if source not in SHARDED_SOURCES:
+        raise ValueError(f"{source} kan niet gesharded worden, kies uit: {', '.join(SHARDED_SOURCES)}")
+    return importlib.import_module(SHARDED_SOURCES[source])
+
+
+# ----------------------------------------
+# Plan -> manifest
+# ----------------------------------------
+def plan(source, date):
+    """Writes the manifest: the ordered list of units (pages/sections/vacancies) to scrape."""
+    scraper = load_scraper(source)
+    if getattr(scraper, "PLAN_NEEDS_DRIVER", True):
+        driver = scraper.get_driver()
+        try:
+            units = scraper.plan(driver)
+        finally:
+            driver.quit()
+    else:
+        units = scraper.plan()
+
+    path = manifest_path(source, date)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with atomic_write(path) as f:
+        json.dump({
+            "source": source,
+            "date": date,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "units": units,
+        }, f, indent=4, ensure_ascii=False)
+    print(f"[+] Manifest {path}: {len(units)} units")
+    return units
+
+
+def load_manifest(source, date):
+    with open(manifest_path(source, date), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def shard_slice(units, index, count):
+    """
+    Contiguous slice for shard `index` of `count`. Concatenating the slices
+    in shard order gives back the manifest order, which keeps the merge
+    deterministic whatever the number of shards.
+    """
+    if not 0 <= index < count:
+        raise ValueError(f"Shard index {index} buiten bereik 0..{count - 1}")
+    start = len(units) * index // count
+    end = len(units) * (index + 1) // count
+    return units[start:end]
+
+
+# ----------------------------------------
+# Execute one shard -> partial NDJSON
+# ----------------------------------------
+def execute(source, date, index, count):
+    from extraction_pipeline import ExtractionPipeline
+
+    scraper = load_scraper(source)
+    units = shard_slice(load_manifest(source, date)["units"], index, count)
+    scraper.metrics.source = f"{source}.shard-{index}-of-{count}"
+    # Shards run in parallel: each needs its own Chrome profile and debug files
+    if getattr(scraper, "PROFILE_NAME", None):
+        scraper.PROFILE_NAME = f"{scraper.PROFILE_NAME}-shard-{index}"
+    if hasattr(scraper, "DEBUG_PREFIX"):
+        scraper.DEBUG_PREFIX = f"{scraper.DEBUG_PREFIX}_shard-{index}"
+    print(f"[+] Shard {index + 1}/{count}: {len(units)} units")
+
+    rows = []
+    if units:
+        driver = scraper.get_driver()
+        with ExtractionPipeline() as pipeline:
+            try:
+                scraper.execute(driver, units, pipeline)
+            finally:
+                driver.quit()
+            rows = pipeline.results()
+            scraper.metrics.inc("vacancies_failed", pipeline.failed)
+
+    path = part_path(source, date, index, count)
+    with atomic_write(path) as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    print(f"[+] Saved {len(rows)} rows: {path}")
+
+    scraper.metrics.observe_rows(rows)
+    scraper.metrics.write()
+    return rows
+
+
+# ----------------------------------------
+# Merge partial outputs -> regular snapshot
+# ----------------------------------------
+def merge(source, date, count):
+    """Combines all parts in shard order and saves them like a normal run would."""
+    rows = []
+    for index in range(count):
+        path = part_path(source, date, index, count)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Shard {index} ontbreekt: {path}")
+        with open(path, encoding="utf-8") as f:
+            rows.extend(json.loads(line) for line in f if line.strip())
+
+    scraper = load_scraper(source)
+    scraper.save(rows, output_file=f"{source}_{date}.json")
+    return rows
+
+
+def run_local(source, date, count):
+    """Plan, run all shards as separate processes in parallel, then merge."""
+    plan(source, date)
+    procs = [
+        subprocess.Popen([
+            sys.executable, os.path.abspath(__file__), "execute", source,
+            "--date", date, "--shard", str(index), "--shards", str(count),
+        ])
+        for index in range(count)
+    ]
+    failed = [index for index, proc in enumerate(procs) if proc.wait() != 0]
+    if failed:
+        print(f"[!] Shards mislukt: {failed}")
+        return 1
+    merge(source, date, count)
+    return 0
+
+
+# ----------------------------------------
+# Main
+# ----------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Plan/execute/merge scrapes across multiple runners.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for name in ("plan", "execute", "merge", "run-local"):
+        p = sub.add_parser(name)
+        p.add_argument("source", choices=sorted(SHARDED_SOURCES))
+        p.add_argument("--date", default=datetime.now().strftime("%Y-%m-%d"))
+        if name != "plan":
+            p.add_argument("--shards", type=int, required=name != "run-local", default=2)
+        if name == "execute":
+            p.add_argument("--shard", type=int, required=True, help="0-based shard index")
+    args = parser.parse_args(argv)
+
+    if args.command == "plan":
+        plan(args.source, args.date)
+    elif args.command == "execute":
+        execute(args.source, args.date, args.shard, args.shards)
+    elif args.command == "merge":
+        merge(args.source, args.date, args.shards)
+    else:
+        return run_local(args.source, args.date, args.shards)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
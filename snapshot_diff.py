@@ -0,0 +1,207 @@
+import os
+import sys
+import json
+import hashlib
+import argparse
+import subprocess
+from datetime import datetime
+
+from snapshots import (CIRCLE8_DATE, FIELDS, SNAPSHOT_DIR, iter_records, list_snapshots,
+                       parse_snapshot_name, record_hash)
+
+CHANGES_DIR = "changes"
+
+
+# ----------------------------------------
+# Fingerprints
+# ----------------------------------------
+def field_hash(value):
+    raw = json.dumps(value, ensure_ascii=False)
+    return hashlib.sha1(raw.encode("utf-8")).digest()[:8]
+
+
+def fingerprint(path, source=None):
+    """
+    Streams a snapshot into {uid: (record_hash, {field: field_hash})}.
+
+    Only hashes are kept, so memory does not depend on the size of the
+    vacancy texts.
+    """
+    prints = {}
+    for record in iter_records(path, source):
+        prints[record["uid"]] = (
+            record_hash(record),
+            {field: field_hash(record[field]) for field in FIELDS},
+        )
+    return prints
+
+
+def source_of(path):
+    parsed = parse_snapshot_name(path)
+    if not parsed:
+        raise ValueError(f"Bron van {path} onbekend, geef --source op")
+    return parsed[0]
+
+
+# ----------------------------------------
+# Diff
+# ----------------------------------------
+def diff_snapshots(old_path, new_path, source=None):
+    """
+    Yields change events between two snapshots of the same source:
+
+        {"type": "added",   "uid": ..., "record": {...}}
+        {"type": "changed", "uid": ..., "titel": ..., "fields": {field: {"old": ..., "new": ...}}}
+        {"type": "removed", "uid": ..., "titel": ...}
+
+    Runs in three linear passes: fingerprint old, stream new, then stream
+    old once more to pick up old values of changed and removed records.
+    """
+    source = source or source_of(new_path)
+    old_prints = fingerprint(old_path, source)
+
+    seen = set()
+    changed = {}
+    for record in iter_records(new_path, source):
+        uid = record["uid"]
+        if uid in seen:
+            continue
+        seen.add(uid)
+
+        old = old_prints.get(uid)
+        if old is None:
+            yield {"type": "added", "uid": uid, "record": record}
+        elif old[0] != record_hash(record):
+            changed[uid] = {
+                field: {"new": record[field]}
+                for field in FIELDS
+                if old[1][field] != field_hash(record[field])
+            }
+
+    removed = old_prints.keys() - seen
+    if not changed and not removed:
+        return
+
+    for record in iter_records(old_path, source):
+        uid = record["uid"]
+        if uid in changed:
+            fields = changed.pop(uid)
+            for field, values in fields.items():
+                values["old"] = record[field]
+            yield {"type": "changed", "uid": uid, "titel": record["titel"], "fields": fields}
+        elif uid in removed:
+            removed.discard(uid)
+            yield {"type": "removed", "uid": uid, "titel": record["titel"]}
+
+
+def changed_keys(events):
+    """UIDs that are new or changed, e.g. for the scrape planner or notifications."""
+    return {e["uid"] for e in events if e["type"] in ("added", "changed")}
+
+
+def previous_version(path):
+    """
+    Writes the previous git version of a snapshot to changes/ and returns
+    its path, or None. That is HEAD when the file has uncommitted changes
+    (a fresh scrape), otherwise the commit before the last one touching it.
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+
+    def git(*args, **kwargs):
+        return subprocess.run(["git", *args], cwd=directory, **kwargs)
+
+    if git("diff", "--quiet", "HEAD", "--", name, capture_output=True).returncode != 0:
+        rev = "HEAD"
+    else:
+        log = git("log", "-n", "2", "--format=%H", "--", name, capture_output=True, text=True)
+        revs = log.stdout.split() if log.returncode == 0 else []
+        if len(revs) < 2:
+            return None
+        rev = revs[1]
+
+    out = os.path.join(CHANGES_DIR, f".previous_{name}")
+    os.makedirs(CHANGES_DIR, exist_ok=True)
+    with open(out, "wb") as f:
+        if git("show", f"{rev}:./{name}", stdout=f, stderr=subprocess.DEVNULL).returncode != 0:
+            return None
+    return out
+
+
+def latest_pair(source, directory=SNAPSHOT_DIR):
+    """
+    Returns the paths of the two most recent snapshots of a source, or None.
+    A source with a single accumulating file (circle8.json) is compared
+    with its previous version in git.
+    """
+    snapshots = list_snapshots(directory, source)
+    if len(snapshots) == 1:
+        previous = previous_version(snapshots[0][2])
+        return (previous, snapshots[0][2]) if previous else None
+    if len(snapshots) < 2:
+        return None
+    return snapshots[-2][2], snapshots[-1][2]
+
+
+def write_feed(events, path):
+    """Writes events as NDJSON and returns a count per event type."""
+    counts = {"added": 0, "changed": 0, "removed": 0}
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        for event in events:
+            counts[event["type"]] += 1
+            f.write(json.dumps(event, ensure_ascii=False) + "\n")
+    return counts
+
+
+# ----------------------------------------
+# Main
+# ----------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Diff two vacancy snapshots.")
+    parser.add_argument("old", nargs="?", help="Older snapshot file")
+    parser.add_argument("new", nargs="?", help="Newer snapshot file")
+    parser.add_argument("--source", help="Diff the two latest snapshots of this source")
+    parser.add_argument("--dir", default=SNAPSHOT_DIR)
+    parser.add_argument("--out", help=f"NDJSON output (default: {CHANGES_DIR}/<source>_<date>.ndjson, '-' for stdout)")
+    args = parser.parse_args(argv)
+
+    if args.old and args.new:
+        old_path, new_path = args.old, args.new
+    elif args.source:
+        pair = latest_pair(args.source, args.dir)
+        if not pair:
+            print(f"[!] Minder dan twee snapshots voor {args.source}.")
+            return 1
+        old_path, new_path = pair
+    else:
+        parser.print_help()
+        return 1
+
+    try:
+        source = args.source or source_of(new_path)
+    except ValueError as e:
+        print("[!]", e)
+        return 1
+    events = diff_snapshots(old_path, new_path, source)
+
+    if args.out == "-":
+        for event in events:
+            print(json.dumps(event, ensure_ascii=False))
+        return 0
+
+    # Dated snapshots name the feed after their scrape date, anything else after today
+    parsed = parse_snapshot_name(new_path)
+    if parsed and parsed[1] != CIRCLE8_DATE:
+        feed_date = parsed[1]
+    else:
+        feed_date = datetime.now().strftime("%Y-%m-%d")
+    out = args.out or os.path.join(CHANGES_DIR, f"{source}_{feed_date}.ndjson")
+    counts = write_feed(events, out)
+    print(f"{old_path} -> {new_path}: "
+          f"{counts['added']} nieuw, {counts['changed']} gewijzigd, {counts['removed']} verwijderd")
+    print("Saved:", out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+import os
+import re
+import json
+import hashlib
+
+import ijson
+
+
+SNAPSHOT_DIR = "."
+
+# Bestandsnaam -> (bron, scrape datum), bv. bluetrail_2025-12-06.json
+SNAPSHOT_PATTERN = re.compile(
+    r"^(?P<source>bluetrail|indeed|magnit_global|striive)_(?P<date>\d{4}-\d{2}-\d{2})\.json$"
+)
+CIRCLE8_FILE = "circle8.json"
+# circle8.json accumulates every run in one file and has no scrape date of its
+# own (its mtime is just the checkout time in CI). It always maps to this one
+# fixed scrape_date, so re-exporting it replaces a single partition instead of
+# adding another full copy of the history every day.
+CIRCLE8_DATE = "cumulative"
+
+SOURCES = ["bluetrail", "circle8", "indeed", "magnit_global", "striive"]
+
+# Unified schema shared by all sources
+FIELDS = [
+    "uid", "titel", "organisatie", "plaats", "uren", "start", "eind",
+    "deadline", "tarief", "text", "url", "eisen", "wensen", "competenties",
+]
+LIST_FIELDS = ["eisen", "wensen", "competenties"]
+
+
+# ----------------------------------------
+# Snapshot discovery
+# ----------------------------------------
+def parse_snapshot_name(path):
+    """Returns (source, scrape_date) for a snapshot path, or None."""
+    name = os.path.basename(path)
+    match = SNAPSHOT_PATTERN.match(name)
+    if match:
+        return match.group("source"), match.group("date")
+    if name == CIRCLE8_FILE:
+        return "circle8", CIRCLE8_DATE
+    return None
+
+
+def list_snapshots(directory=SNAPSHOT_DIR, source=None):
+    """Lists (source, scrape_date, path) for all snapshots, oldest first."""
+    snapshots = []
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        parsed = parse_snapshot_name(path)
+        if not parsed:
+            continue
+        if source and parsed[0] != source:
+            continue
+        snapshots.append((parsed[0], parsed[1], path))
+    return sorted(snapshots, key=lambda s: (s[1], s[0]))
+
+
+# ----------------------------------------
+# Raw reading (every source has its own JSON layout)
+# ----------------------------------------
+def iter_raw_items(path, source=None):
+    """
+    Yields (key, raw_row) pairs from a snapshot.
+
+    bluetrail/striive/circle8 use orient="index", indeed {"jobs": [...]}
+    and magnit pandas' default column orient. Index and jobs files are
+    always streamed with ijson (a hard dependency, so this can never fall
+    back to loading e.g. the whole circle8.json history); the column orient
+    can only be turned into rows after reading the whole file.
+    """
+    source = source or parse_snapshot_name(path)[0]
+
+    if source == "magnit_global":
+        with open(path, encoding="utf-8") as f:
+            columns = json.load(f)
+        keys = {}
+        for values in columns.values():
+            keys.update(dict.fromkeys(values))
+        for key in keys:
+            yield key, {col: values.get(key) for col, values in columns.items()}
+        return
+
+    with open(path, "rb") as f:
+        if source == "indeed":
+            for i, job in enumerate(ijson.items(f, "jobs.item", use_float=True)):
+                yield str(i), job
+        else:
+            for key, row in ijson.kvitems(f, "", use_float=True):
+                yield key, row
+
+
+# ----------------------------------------
+# Normalisation to the unified schema
+# ----------------------------------------
+def content_uid(*parts):
+    """Stable UID for sources without a usable key (same form as circle8)."""
+    raw = "\n".join(str(p or "") for p in parts)
+    return "UID-" + hashlib.md5(raw.encode("utf-8")).hexdigest()[:12]
+
+
+def _text(value):
+    if value is None:
+        return ""
+    return str(value).strip()
+
+
+def _list(value):
+    if not value:
+        return []
+    if isinstance(value, (list, tuple)):
+        return [_text(v) for v in value]
+    return [_text(value)]
+
+
+def normalize(source, key, raw):
+    """Maps one raw row of a source onto FIELDS."""
+    if source == "bluetrail":
+        row = {
+            "uid": key or content_uid(raw.get("titel"), raw.get("text")),
+            "titel": raw.get("titel"),
+            "plaats": raw.get("plaats"),
+            "uren": raw.get("uren"),
+            "start": raw.get("start"),
+            "eind": raw.get("eind"),
+            "deadline": raw.get("deadline"),
+            "text": raw.get("text"),
+            "eisen": raw.get("eisen"),
+            "wensen": raw.get("wensen"),
+            "competenties": raw.get("competenties"),
+        }
+    elif source == "magnit_global":
+        row = {
+            "uid": key,
+            "titel": raw.get("titel"),
+            "plaats": raw.get("locatie"),
+            "uren": raw.get("uren per week"),
+            "start": raw.get("start datum"),
+            "eind": raw.get("eind datum"),
+            "deadline": raw.get("deadline aanvraag"),
+            "tarief": raw.get("max uur tarief"),
+            "text": raw.get("vacature tekst"),
+        }
+    elif source == "striive":
+        # UID was a running counter in older snapshots, so prefer the reference code
+        row = {
+            "uid": raw.get("referentie_code") or content_uid(raw.get("vacature"), raw.get("text")),
+            "titel": raw.get("vacature"),
+            "plaats": raw.get("plaats"),
+            "uren": raw.get("uren"),
+            "start": raw.get("start"),
+            "eind": raw.get("eind"),
+            "deadline": raw.get("deadline"),
+            "text": raw.get("text"),
+            "eisen": raw.get("eisen"),
+            "wensen": raw.get("wensen"),
+        }
+    elif source == "indeed":
+        row = {
+            "uid": content_uid(raw.get("title"), raw.get("company"), raw.get("location")),
+            "titel": raw.get("title"),
+            "organisatie": raw.get("company"),
+            "plaats": raw.get("location"),
+            "tarief": raw.get("pay"),
+            "text": raw.get("description"),
+        }
+    elif source == "circle8":
+        # circle8_scraper.py writes title/raw, the playwright version titel/text
+        row = {
+            "uid": key,
+            "titel": raw.get("titel") or raw.get("title"),
+            "text": raw.get("text") or raw.get("raw"),
+            "url": raw.get("url"),
+        }
+    else:
+        raise ValueError(f"Onbekende bron: {source}")
+
+    return {
+        field: _list(row.get(field)) if field in LIST_FIELDS else _text(row.get(field))
+        for field in FIELDS
+    }
+
+
+def iter_records(path, source=None):
+    """Yields unified records (FIELDS) for every vacancy in a snapshot."""
+    source = source or parse_snapshot_name(path)[0]
+    for key, raw in iter_raw_items(path, source):
+        yield normalize(source, key, raw)
+
+
+def record_hash(record):
+    """Content hash of a unified record, independent of key order."""
+    raw = json.dumps(record, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
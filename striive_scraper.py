@@ -10,12 +10,21 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support import expected_conditions as EC
 import chromedriver_autoinstaller
 
+from browser_profile import apply_profile
+from checkpoint import Checkpoint
+from extraction_pipeline import ExtractionPipeline
+from extractors import extract_striive
+from metrics import RunMetrics
+from snapshots import content_uid
+
 
 # ============================================================
 # Save output in repository root
 # ============================================================
 OUTPUT_DIR = "."
 
+metrics = RunMetrics("striive")
+
 
 # ============================================================
 # Chrome driver setup
@@ -24,12 +33,13 @@ def get_driver():
     chromedriver_autoinstaller.install()
 
     options = Options()
-    options.add_argument("--headless=new")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--window-size=1920,1080")
+    # Fresh profile: go_to_page() waits for the login form on every run
+    apply_profile(options)
 
-    return webdriver.Chrome(options=options)
+    with metrics.timer("browser_start"):
+        driver = webdriver.Chrome(options=options)
+    metrics.inc("browser_starts")
+    return driver
 
 
 # ============================================================
@@ -78,42 +88,6 @@ def safe_text(el):
     return el.text.strip() if el else ""
 
 
-def extract_job(driver, uid):
-    """Extract structured job data from the details panel."""
-
-    def t(xpath):
-        try:
-            return driver.find_element(By.XPATH, xpath).text.strip()
-        except:
-            return ""
-
-    return {
-        "UID": uid,
-        "referentie_code": t('(//span[@class="field-value"])[7]'),
-        "vacature": t('//header//div/div[2]'),
-        "plaats": t('(//section[2]//span[@class="field-value"])[2]'),
-        "uren": t('(//section[2]//span[@class="field-value"])[1]'),
-        "text": t('//section[4]/p') or t('//section[5]/p'),
-        "start": "".join(c for c in t('(//section[2]//span[@class="field-value"])[3]') if c.isdigit() or c == "-"),
-        "eind": t('(//span[@class="field-value"])[3]'),
-        "deadline": "".join(c for c in t('(//section[2]//span[@class="field-value"])[4]') if c.isdigit() or c == "-"),
-        "eisen": extract_list(driver, "(//section[3]//ul)[1]/li"),
-        "wensen": extract_list(driver, "(//section[3]//ul)[2]/li//span/span"),
-    }
-
-
-def extract_list(driver, base_xpath):
-    items = []
-    for i in range(1, 30):
-        try:
-            txt = driver.find_element(By.XPATH, f"{base_xpath}[{i}]").text.strip()
-            if txt:
-                items.append(txt)
-        except:
-            break
-    return items
-
-
 # ============================================================
 # Infinite scroll logic for job list
 # ============================================================
@@ -160,11 +134,11 @@ def main():
         f"striive_{datetime.now().strftime('%Y-%m-%d')}.json"
     )
 
-    rows = []
-    uid = 0
+    checkpoint = Checkpoint("striive")
 
-    with get_driver() as driver:
-        go_to_page(driver)
+    with get_driver() as driver, ExtractionPipeline() as pipeline:
+        with metrics.timer("login"):
+            go_to_page(driver)
         wait = WebDriverWait(driver, 20)
 
         wait.until(
@@ -172,37 +146,57 @@ def main():
         )
 
         print("📌 Loading all jobs via infinite scroll...")
-        job_items = load_all_job_items(driver)
+        with metrics.timer("listing_load"):
+            job_items = load_all_job_items(driver)
 
         print(f"📌 Total jobs loaded: {len(job_items)}")
+        metrics.inc("vacancies_found", len(job_items))
 
         for item in job_items:
             try:
-                driver.execute_script("arguments[0].scrollIntoView();", item)
-                item.click()
-                time.sleep(1)
-
-                row = extract_job(driver, uid)
-                rows.append(row)
-                uid += 1
+                # List item text (title, client, dates) identifies the vacancy across
+                # reruns, also when new vacancies were added to the list meanwhile
+                uid = content_uid(item.text)
+                if checkpoint.is_done(uid):
+                    continue
+
+                with metrics.timer("vacancy_load"):
+                    driver.execute_script("arguments[0].scrollIntoView();", item)
+                    item.click()
+                    time.sleep(1)
+                    page_source = driver.page_source
+
+                metrics.add_bytes(page_source)
+                future = pipeline.submit(extract_striive, page_source, uid)
+                checkpoint.track(future, uid)
 
             except Exception as e:
                 print("Error scraping job:", e)
+                metrics.inc("vacancies_failed")
                 continue
 
+        with metrics.timer("extract_wait"):
+            rows = checkpoint.previous_rows + pipeline.results()
+        metrics.inc("vacancies_failed", pipeline.failed)
+
     # Build dataframe and remove duplicates by reference code
     df = pd.DataFrame(rows).drop_duplicates(subset=["referentie_code"])
 
     absfile = os.path.abspath(output_file)
     print("💾 Saving JSON to:", absfile)
 
-    df.to_json(output_file, orient="index", indent=4)
+    with metrics.timer("save"):
+        df.to_json(output_file, orient="index", indent=4)
+    metrics.observe_rows(df.to_dict("records"))
 
     if os.path.exists(output_file):
         print("✅ File successfully created:", absfile)
+        checkpoint.close(completed=True)
     else:
         print("❌ ERROR: file not created:", absfile)
 
+    metrics.write()
+
 
 # ============================================================
 # Entry point
@@ -0,0 +1,5 @@
+"""
+Single entry point for the vacancy scrapers: python -m veneficus <command>.
+
+Nothing heavy is imported here; see cli.py.
+"""
@@ -0,0 +1,180 @@
+import os
+import re
+import sys
+import json
+import argparse
+import importlib
+import statistics
+import subprocess
+
+# The scrapers and tools are top-level modules next to this package
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# Command -> module that implements it. Modules are imported only when their
+# command runs, so e.g. `diff` never loads selenium, pandas or dotenv.
+COMMANDS = {
+    "sources": "snapshots",
+    "diff": "snapshot_diff",
+    "export": "parquet_exporter",
+    "search": "search_index",
+    "bench": "bench_browser",
+}
+SCRAPERS = {
+    "bluetrail": "bluetrail_scraper",
+    "circle8": "circle8_playwright_scraper",
+    "indeed": "indeed_scraper",
+    "magnit_global": "magnit_global_scraper",
+    "striive": "striive_scraper",
+}
+# Commands whose own argparse handles the remaining arguments
+FORWARDED = ("diff", "export", "search", "bench")
+
+# Packages that should only show up for browser work (scrape, bench)
+HEAVY_PACKAGES = ["selenium", "webdriver_manager", "undetected_chromedriver",
+                  "chromedriver_autoinstaller", "playwright", "pandas", "pyarrow", "dotenv"]
+
+
+def load(command, source=None):
+    """Imports the module behind a command (or a scraper for `scrape`)."""
+    if command == "scrape":
+        return importlib.import_module(SCRAPERS[source])
+    return importlib.import_module(COMMANDS[command])
+
+
+# ----------------------------------------
+# Commands
+# ----------------------------------------
+def list_sources(directory):
+    snapshots = load("sources")
+    found = {}
+    for source, date, path in snapshots.list_snapshots(directory):
+        found.setdefault(source, []).append(date)
+
+    print(f"{'source':<15} {'scraper':<30} {'snapshots':>9}  laatste")
+    for source in snapshots.SOURCES:
+        dates = found.get(source, [])
+        print(f"{source:<15} {SCRAPERS[source] + '.py':<30} {len(dates):>9}  {dates[-1] if dates else '-'}")
+    return 0
+
+
+def scrape(source):
+    scraper = load("scrape", source)
+    scraper.main()
+    return 0
+
+
+# ----------------------------------------
+# Startup benchmark
+# ----------------------------------------
+def startup_cases():
+    cases = [("cli", None), ("sources", None), ("diff", None), ("export", None),
+             ("search", None), ("bench", None)]
+    return cases + [("scrape", source) for source in SCRAPERS]
+
+
+def measure_startup(command, source=None):
+    """
+    Imports one command in a fresh interpreter with -X importtime. Returns
+    the import time in ms and the heavy packages that got loaded, or None
+    when the import fails (e.g. selenium not installed here).
+    """
+    if command == "cli":
+        code = "import veneficus.cli"
+    else:
+        code = f"import veneficus.cli as cli; cli.load({command!r}, {source!r})"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        return None
+
+    total_us = 0
+    heavy = set()
+    for line in proc.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        m = re.match(r"import time:\s*(\d+)\s*\|\s*\d+\s*\|\s*(\S+)", line)
+        if not m:
+            continue
+        total_us += int(m.group(1))
+        package = m.group(2).split(".")[0]
+        if package in HEAVY_PACKAGES:
+            heavy.add(package)
+    return {"import_ms": total_us / 1000, "heavy": sorted(heavy)}
+
+
+def bench_startup(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m veneficus bench startup",
+        description="Measure import time per subcommand in fresh interpreters.",
+    )
+    parser.add_argument("--runs", type=int, default=5, help="Interpreters per command")
+    parser.add_argument("--json", help="Also write results to this file")
+    args = parser.parse_args(argv)
+
+    results = {}
+    print(f"{'command':<24} {'import (median)':>16}  heavy packages")
+    for command, source in startup_cases():
+        name = f"{command} {source}" if source else command
+        runs = [measure_startup(command, source) for _ in range(args.runs)]
+        if None in runs:
+            print(f"{name:<24} {'import faalt':>16}  (dependencies ontbreken?)")
+            results[name] = None
+            continue
+        median = statistics.median(r["import_ms"] for r in runs)
+        heavy = runs[0]["heavy"]
+        results[name] = {"import_ms_median": round(median, 2),
+                         "import_ms_runs": [round(r["import_ms"], 2) for r in runs],
+                         "heavy_packages": heavy}
+        print(f"{name:<24} {median:>13.1f} ms  {', '.join(heavy) or '-'}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+        print("Resultaten opgeslagen:", args.json)
+
+    # Only browser commands may pull in the browser/dataframe stack
+    leaks = [name for name, r in results.items()
+             if r and r["heavy_packages"] and not name.startswith(("scrape", "bench"))]
+    if leaks:
+        print("[!] Zware imports bij:", ", ".join(leaks))
+        return 1
+    return 0
+
+
+# ----------------------------------------
+# Main
+# ----------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m veneficus",
+        description="Vacancy scrapers and snapshot tools. Heavy dependencies load per command.",
+    )
+    sub = parser.add_subparsers(dest="command", required=True, metavar="command")
+
+    p = sub.add_parser("sources", help="List sources and their snapshots")
+    p.add_argument("--dir", default=".", help="Directory with JSON snapshots")
+
+    p = sub.add_parser("scrape", help="Run the scraper for a source")
+    p.add_argument("source", choices=sorted(SCRAPERS))
+
+    sub.add_parser("diff", add_help=False, help="Diff two snapshots (snapshot_diff.py)")
+    sub.add_parser("export", add_help=False, help="Export snapshots to Parquet (parquet_exporter.py)")
+    sub.add_parser("search", add_help=False, help="Full-text index and search (search_index.py)")
+    sub.add_parser("bench", add_help=False,
+                   help="Browser benchmark (bench_browser.py); 'bench startup' measures import time")
+
+    args, rest = parser.parse_known_args(argv)
+
+    if args.command in FORWARDED:
+        sys.argv[0] = f"{parser.prog} {args.command}"
+        if args.command == "bench" and rest[:1] == ["startup"]:
+            return bench_startup(rest[1:])
+        return load(args.command).main(rest)
+    if rest:
+        parser.error(f"unrecognized arguments: {' '.join(rest)}")
+    if args.command == "sources":
+        return list_sources(args.dir)
+    return scrape(args.source)